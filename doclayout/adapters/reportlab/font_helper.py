@@ -2,6 +2,15 @@
 Font resolution utilities for ReportLab renderer.
 """
 
+import functools
+
+# Style variants per ReportLab base font: (regular, bold, italic, bold-italic)
+_STYLE_VARIANTS = {
+    "Helvetica": ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique", "Helvetica-BoldOblique"),
+    "Times-Roman": ("Times-Roman", "Times-Bold", "Times-Italic", "Times-BoldItalic"),
+    "Courier": ("Courier", "Courier-Bold", "Courier-Oblique", "Courier-BoldOblique"),
+}
+
 class FontHelper:
     """
     Handles mapping from generic font names to ReportLab's standard fonts.
@@ -16,9 +25,11 @@ class FontHelper:
     }
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def resolve(font_name: str, bold: bool = False, italic: bool = False) -> str:
         """
         Map a font name and style to a ReportLab standard font name.
+        Results are cached, since only a handful of combinations occur in practice.
 
         Args:
             font_name (str): The requested font family.
@@ -29,21 +40,7 @@ class FontHelper:
             str: The ReportLab font identifier.
         """
         base = FontHelper.FONT_MAPPING.get(font_name, "Helvetica")
-        
-        if base == "Helvetica":
-            if bold and italic: return "Helvetica-BoldOblique"
-            if bold: return "Helvetica-Bold"
-            if italic: return "Helvetica-Oblique"
-            return "Helvetica"
-        elif base == "Times-Roman":
-            if bold and italic: return "Times-BoldItalic"
-            if bold: return "Times-Bold"
-            if italic: return "Times-Italic"
-            return "Times-Roman"
-        elif base == "Courier":
-            if bold and italic: return "Courier-BoldOblique"
-            if bold: return "Courier-Bold"
-            if italic: return "Courier-Oblique"
-            return "Courier"
-            
-        return base
+        variants = _STYLE_VARIANTS.get(base)
+        if variants is None:
+            return base
+        return variants[(1 if bold else 0) + (2 if italic else 0)]
@@ -8,7 +8,7 @@ from doclayout.engine.renderer_api import Renderer
 
 from .font_helper import FontHelper
 from .shapes import ShapeDrawer
-from .text_utils import TextDrawer
+from .text_utils import TextDrawer, TextItem
 
 class ReportLabRenderer(Renderer):
     """
@@ -57,6 +57,36 @@ class ReportLabRenderer(Renderer):
         TextDrawer.draw_text(self._canvas, x, y, text, self._height, resolved, 
                             font_size, color, alignment, width, wrap, auto_scale)
 
+    def draw_batch(self, ops) -> None:
+        """
+        Execute draw ops in order. Runs of consecutive text ops are drawn
+        together so font and fill color are only set when they change.
+        """
+        if not self._canvas: return
+        
+        i, n = 0, len(ops)
+        while i < n:
+            name, args, kwargs = ops[i]
+            if name != "draw_text":
+                getattr(self, name)(*args, **kwargs)
+                i += 1
+                continue
+            
+            run = []
+            while i < n and ops[i][0] == "draw_text":
+                _, args, kwargs = ops[i]
+                run.append(self._text_item(*args, **kwargs))
+                i += 1
+            TextDrawer.draw_text_run(self._canvas, run, self._height)
+
+    @staticmethod
+    def _text_item(x, y, text, font_name="Helvetica", font_size=12,
+                   color="black", alignment="left", width=None,
+                   bold=False, italic=False, wrap=False, auto_scale=False, **_box) -> TextItem:
+        """Normalize draw_text arguments into a TextDrawer item."""
+        resolved = FontHelper.resolve(font_name, bold, italic)
+        return (x, y, text, resolved, font_size, color, alignment, width, wrap, auto_scale)
+
     def draw_image(self, x, y, w, h, path) -> None:
         if not self._canvas or not path: return
         try:
@@ -2,11 +2,14 @@
 Text drawing and wrapping for ReportLab renderer.
 """
 
-from typing import Optional
+from typing import Optional, List, Tuple
 from reportlab.lib.utils import simpleSplit
 from reportlab.pdfbase.pdfmetrics import stringWidth
 from .shapes import ShapeDrawer
 
+# A text draw request: (x, y, text, font_name, font_size, color, alignment, width, wrap, auto_scale)
+TextItem = Tuple[float, float, str, str, float, str, str, Optional[float], bool, bool]
+
 class TextDrawer:
     """
     Handles complex text drawing including wrapping and auto-scaling.
@@ -16,18 +19,50 @@ class TextDrawer:
                   font_name: str, font_size: float, color: str,
                   alignment: str, width: Optional[float],
                   wrap: bool, auto_scale: bool) -> None:
-        
+
         canvas.saveState()
         canvas.setFillColor(ShapeDrawer.get_color(color))
-        
+        TextDrawer._draw_lines(canvas, x, y, text, page_h, font_name, font_size,
+                               alignment, width, wrap, auto_scale, None)
+        canvas.restoreState()
+
+    @staticmethod
+    def draw_text_run(canvas, items: List[TextItem], page_h: float) -> None:
+        """
+        Draw several text items inside one saved state.
+        Items keep their paint order; font and fill color are only set when they
+        differ from the previous item.
+        """
+        canvas.saveState()
+        last_color = None
+        current_font = None
+        for x, y, text, font_name, font_size, color, alignment, width, wrap, auto_scale in items:
+            if current_font is None or color != last_color:
+                canvas.setFillColor(ShapeDrawer.get_color(color))
+                last_color = color
+            current_font = TextDrawer._draw_lines(canvas, x, y, text, page_h, font_name, font_size,
+                                                  alignment, width, wrap, auto_scale, current_font)
+        canvas.restoreState()
+
+    @staticmethod
+    def _draw_lines(canvas, x: float, y: float, text: str, page_h: float,
+                    font_name: str, font_size: float,
+                    alignment: str, width: Optional[float],
+                    wrap: bool, auto_scale: bool,
+                    current_font: Optional[Tuple[str, float]]) -> Tuple[str, float]:
+        """
+        Draw wrapped/scaled text with the fill color already set.
+        Only calls setFont when it differs from current_font; returns the font in effect.
+        """
         fs = font_size
         if auto_scale and width and width > 0:
             tw = stringWidth(text, font_name, fs)
             if tw > width:
                 fs = fs * (width / tw) * 0.98
-        
-        canvas.setFont(font_name, fs)
-        
+
+        if current_font != (font_name, fs):
+            canvas.setFont(font_name, fs)
+
         lines = []
         if not auto_scale and wrap and width and width > 0:
             # Handle paragraphs by splitting by \n first
@@ -41,10 +76,10 @@ class TextDrawer:
                 lines.extend(p_lines)
         else:
             lines = [text]
-        
+
         line_h = fs * 1.2
         start_pdf_y = page_h - (y + (fs * 0.8))
-        
+
         for i, line in enumerate(lines):
             draw_y = start_pdf_y - (i * line_h)
             if alignment == "center":
@@ -53,5 +88,5 @@ class TextDrawer:
                 canvas.drawRightString(x + (width if width else 0), draw_y, line)
             else:
                 canvas.drawString(x, draw_y, line)
-        
-        canvas.restoreState()
+
+        return (font_name, fs)
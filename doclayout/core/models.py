@@ -79,6 +79,15 @@ class BaseElement(BaseModel):
     def lock_selection(self) -> bool:
         return self.props.get("lock_selection", False)
 
+    def clone_flat(self, x: float, y: float) -> 'BaseElement':
+        """
+        Return a childless copy of this element placed at (x, y).
+
+        Only the top level of props is copied, so the clone's props can be
+        reassigned independently; bindings are shared since they are only read.
+        """
+        return self.model_copy(update={"x": x, "y": y, "props": self.props.copy(), "children": []})
+
 class BlockBase(BaseModel):
     """
     Base definition of a reusable Block.
@@ -1,13 +1,16 @@
 """
 Centralized Export logic for DocLayout.
 """
-from typing import List, Dict, Any, Optional
+import functools
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
 from doclayout.core.models import Template, ElementType, BaseElement
-from doclayout.core.geometry import mm_to_pt
+from doclayout.core.geometry import mm_to_pt, MM_TO_PT
 from doclayout.engine.layout import LayoutEngine
-from doclayout.engine.renderer_api import Renderer
+from doclayout.engine.renderer_api import Renderer, DrawOp
 from doclayout.adapters.reportlab.font_helper import FontHelper
 from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.lib.utils import simpleSplit
 
 # Constants for thermal paper and layout
 THERMAL_PAPER_58MM = 58
@@ -16,6 +19,183 @@ THERMAL_PAPER_BOTTOM_MARGIN_MM = 10
 PAGE_TOP_MARGIN_MM = 20  # Top margin for split elements on new pages
 KV_BOX_PADDING_MM = 1.5
 KV_BOX_TEXT_PADDING_MM = 0.5
+TEXT_BOX_PADDING_MM = 1.0  # Visual padding, consistent with the Editor
+
+# Paddings pre-converted to points for the render handlers
+_TEXT_BOX_PADDING_PT = TEXT_BOX_PADDING_MM * MM_TO_PT
+_KV_BOX_PADDING_PT = KV_BOX_PADDING_MM * MM_TO_PT
+_KV_BOX_TEXT_PADDING_PT = KV_BOX_TEXT_PADDING_MM * MM_TO_PT
+
+# Element types whose font is resolved before pagination
+_TEXT_ELEMENT_TYPES = (ElementType.TEXT, ElementType.TEXT_BOX, ElementType.KV_BOX)
+
+@functools.lru_cache(maxsize=256)
+def _resolve_font(font_family: str, bold: bool = False, italic: bool = False) -> str:
+    """
+    Resolve a font family/style to a ReportLab font name.
+    Results are cached, including the Helvetica fallback for unknown fonts.
+    """
+    try:
+        return FontHelper.resolve(font_family, bold, italic)
+    except Exception:
+        return "Helvetica"
+
+@functools.lru_cache(maxsize=64)
+def _char_widths(font_name: str) -> Dict[str, float]:
+    """
+    Glyph widths of the printable ASCII range for a font, at 1pt.
+    """
+    return {chr(c): stringWidth(chr(c), font_name, 1) for c in range(32, 127)}
+
+def _text_width(text: str, font_name: str, font_size: float) -> float:
+    """
+    Width of a single line of text in points, using the cached glyph table.
+    Falls back to stringWidth for text outside the printable ASCII range.
+    """
+    widths = _char_widths(font_name)
+    try:
+        return sum(widths[c] for c in text) * font_size
+    except KeyError:
+        return stringWidth(text, font_name, font_size)
+
+def _wrap_paragraph(text: str, font_name: str, font_size: float, width_pt: float) -> List[str]:
+    """
+    Greedy word wrap with the same line breaks as ReportLab's simpleSplit.
+    
+    Word widths come from the cached glyph table, so each word is measured
+    once. Text outside the printable ASCII range falls back to simpleSplit.
+    """
+    widths = _char_widths(font_name)
+    words = text.split()
+    try:
+        word_widths = [sum(widths[c] for c in word) * font_size for word in words]
+    except KeyError:
+        return simpleSplit(text, font_name, font_size, width_pt)
+    
+    space_w = widths[" "] * font_size
+    lines: List[str] = []
+    current: List[str] = []
+    line_w = -space_w
+    for word, word_w in zip(words, word_widths):
+        if line_w + space_w + word_w <= width_pt or not current:
+            current.append(word)
+            line_w += space_w + word_w
+        else:
+            lines.append(" ".join(current))
+            current = [word]
+            line_w = word_w
+    if current:
+        lines.append(" ".join(current))
+    return lines
+
+def _plan_table_splits(num_rows: int, row_height: float, available_height: float,
+                       page_capacity: float) -> List[Tuple[int, int, int]]:
+    """
+    Plan where a table's rows are cut across pages.
+    
+    Args:
+        num_rows: Number of data rows
+        row_height: Height of a single row in mm
+        available_height: Space left on the page where the table starts
+        page_capacity: Space on each following page, below the top margin
+    
+    Returns:
+        List of (page_offset, first_row, end_row) slices, in page order
+    """
+    plan: List[Tuple[int, int, int]] = []
+    page_offset = 0
+    first_row = 0
+    available = available_height
+    while first_row < num_rows:
+        rows_that_fit = int(available / row_height) if available >= row_height else 0
+        if rows_that_fit == 0 and page_offset > 0:
+            # A row taller than a whole page still has to go somewhere
+            rows_that_fit = 1
+        if rows_that_fit:
+            end_row = min(num_rows, first_row + rows_that_fit)
+            plan.append((page_offset, first_row, end_row))
+            first_row = end_row
+        page_offset += 1
+        available = page_capacity
+    return plan
+
+@dataclass(slots=True)
+class _SplitView:
+    """
+    A page part of a split TABLE or TEXT_BOX element.
+    Holds only what differs from the source element instead of a deep copy.
+    """
+    src: BaseElement
+    y: float
+    height: float
+    data_slice: Optional[Tuple[int, int]] = None
+    text: Optional[str] = None
+    # Built on first access of props, then shared with materialize()
+    _props: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def type(self) -> ElementType:
+        return self.src.type
+
+    @property
+    def x(self) -> float:
+        return self.src.x
+
+    @property
+    def width(self) -> float:
+        return self.src.width
+
+    @property
+    def props(self) -> Dict[str, Any]:
+        """Source props with this part's data rows or text applied."""
+        props = self._props
+        if props is None:
+            props = dict(self.src.props)
+            if self.data_slice is not None:
+                first_row, end_row = self.data_slice
+                props["data"] = props.get("data", [])[first_row:end_row]
+            if self.text is not None:
+                props["text"] = self.text
+            self._props = props
+        return props
+
+    def materialize(self) -> BaseElement:
+        """Build a shallow element copy for rendering."""
+        return self.src.model_copy(update={"y": self.y, "height": self.height, "props": self.props})
+
+class _DrawRecorder:
+    """
+    Stand-in renderer that records draw calls as ops for Renderer.draw_batch.
+    """
+    def __init__(self):
+        self.ops: List[DrawOp] = []
+
+    def draw_rect(self, *args, **kwargs):
+        self.ops.append(("draw_rect", args, kwargs))
+
+    def draw_line(self, *args, **kwargs):
+        self.ops.append(("draw_line", args, kwargs))
+
+    def draw_image(self, *args, **kwargs):
+        self.ops.append(("draw_image", args, kwargs))
+
+    def draw_text(self, *args, **kwargs):
+        self.ops.append(("draw_text", args, kwargs))
+
+    def draw_table(self, *args, **kwargs):
+        self.ops.append(("draw_table", args, kwargs))
+
+def _draw_ops(renderer: Renderer, ops: List[DrawOp]) -> None:
+    """
+    Send a page's draw ops to the renderer: as one draw_batch() call when it
+    has one, otherwise replayed one method call at a time.
+    """
+    draw_batch = getattr(renderer, "draw_batch", None)
+    if draw_batch is not None:
+        draw_batch(ops)
+        return
+    for name, args, kwargs in ops:
+        getattr(renderer, name)(*args, **kwargs)
 
 class TemplateExporter:
     """
@@ -23,6 +203,19 @@ class TemplateExporter:
     """
     def __init__(self, block_provider: Optional[Dict[str, Any]] = None):
         self.engine = LayoutEngine(block_provider or {})
+        # Per-type render handlers, looked up once per element in _plan_elements
+        self._handlers = {
+            ElementType.RECT: self._render_rect,
+            ElementType.TEXT: self._render_text,
+            ElementType.TEXT_BOX: self._render_text_box,
+            ElementType.IMAGE: self._render_image,
+            ElementType.LINE: self._render_line,
+            ElementType.KV_BOX: self._render_kv_box,
+            ElementType.CONTAINER: self._render_container,
+            ElementType.TABLE: self._render_table,
+        }
+        # Lowest element bottom (mm) after the last _adjust_dynamic_heights pass
+        self._content_bottom = 0.0
 
     def export(self, template: Template, renderer: Renderer, output_path: str):
         """
@@ -33,28 +226,25 @@ class TemplateExporter:
         # Calculate dynamic heights for tables and text boxes, adjust element positions
         elements = self._adjust_dynamic_heights(elements)
         
+        # Resolve fonts once up front for measuring and splitting
+        self._resolve_fonts(elements)
+        
         # Calculate page height
         page_w = template.page_size.width
         page_h = template.page_size.height
         
         # Check if this is thermal paper (dynamic height)
-        is_thermal = page_w in [THERMAL_PAPER_58MM, THERMAL_PAPER_80MM]
+        is_thermal = page_w in (THERMAL_PAPER_58MM, THERMAL_PAPER_80MM)
         
         if is_thermal:
-            # Thermal paper: calculate total height needed
-            max_y = 0
-            for elem in elements:
-                max_y = max(max_y, elem.y + elem.height)
-            actual_height = max_y + THERMAL_PAPER_BOTTOM_MARGIN_MM
+            # Thermal paper: total height needed, measured by _adjust_dynamic_heights
+            actual_height = self._content_bottom + THERMAL_PAPER_BOTTOM_MARGIN_MM
             
             # Setup renderer for single page
             renderer.set_page_size(mm_to_pt(page_w), mm_to_pt(actual_height))
             renderer.initialize(output_path)
             renderer.start_page()
-            
-            for elem in elements:
-                self._render_element(elem, renderer)
-                
+            _draw_ops(renderer, self._plan_elements(elements))
             renderer.end_page()
         else:
             # Fixed page size (A4, etc): use pagination with configured top margin
@@ -68,26 +258,51 @@ class TemplateExporter:
             # Render each page
             for page_elements in pages:
                 renderer.start_page()
-                for elem in page_elements:
-                    self._render_element(elem, renderer)
+                _draw_ops(renderer, self._plan_elements(page_elements))
                 renderer.end_page()
         
         renderer.save(output_path)
         return output_path
 
+    def _resolve_fonts(self, elements: List[BaseElement]) -> None:
+        """
+        Store each text element's ReportLab font name in props["_resolved_font"].
+        Only the exporter's own text measuring reads it; draw_text still gets the
+        family and style, since the Renderer API is backend-neutral.
+        """
+        for elem in elements:
+            if elem.type in _TEXT_ELEMENT_TYPES:
+                props = elem.props
+                props["_resolved_font"] = _resolve_font(props.get("font_family", "Helvetica"),
+                                                        props.get("font_bold", False),
+                                                        props.get("font_italic", False))
+
     def _paginate_elements(self, elements: List[BaseElement], page_height: float, top_margin: float) -> List[List[BaseElement]]:
         """
         Split elements across multiple pages based on their absolute Y coordinates.
         Preserves multi-column layouts and absolute positioning.
+        Elements are moved in place; they are the compiled clone_flat copies.
         """
-        import copy
-        
+        # Local aliases keep the per-element type checks cheap
+        _TABLE = ElementType.TABLE
+        _TEXT_BOX = ElementType.TEXT_BOX
+        _LINE = ElementType.LINE
+
         # Sort elements by Y to process top-to-bottom
         # This is important for split logic and queue processing
         sorted_elements = sorted(elements, key=lambda e: e.y)
-        
+
+        # Fast path: everything fits on the first page, so nothing needs splitting.
+        # Dynamic heights are already applied, so the bottoms are final.
+        if max((e.y + e.height for e in sorted_elements), default=0) <= page_height:
+            for elem in sorted_elements:
+                if elem.type == _LINE:
+                    elem.props.setdefault("x2", elem.x)
+                    elem.props.setdefault("y2", elem.y)
+            return [sorted_elements]
+
         pages: List[List[BaseElement]] = []
-        queue = [copy.deepcopy(e) for e in sorted_elements]
+        queue = list(sorted_elements)
         
         while queue:
             elem = queue.pop(0)
@@ -106,22 +321,18 @@ class TemplateExporter:
             
             # Check if element overflows the current page
             if local_y + elem.height > page_height:
-                if elem.type == ElementType.TABLE:
-                    # Split table
+                if elem.type == _TABLE and elem.props.get("data"):
+                    # Split table across as many pages as it needs in one go
                     available = page_height - local_y
-                    first, remaining = self._split_table(elem, available)
-                    
-                    if first:
-                        first.y = local_y
-                        pages[start_page_idx].append(first)
-                    
-                    if remaining:
-                        # Move remaining part to start of next page
-                        # We project it in absolute space so start_page_idx logic works next loop
-                        remaining.y = (start_page_idx + 1) * page_height + top_margin
-                        queue.insert(0, remaining)
+                    for page_offset, part in self._split_table(elem, available, page_height - top_margin):
+                        page_idx = start_page_idx + page_offset
+                        while len(pages) <= page_idx:
+                            pages.append([])
+                        # Continuation parts start below the top margin of their page
+                        part.y = local_y if page_offset == 0 else top_margin
+                        pages[page_idx].append(part)
                 
-                elif elem.type == ElementType.TEXT_BOX:
+                elif elem.type == _TEXT_BOX:
                     # Split textbox
                     available = page_height - local_y
                     first, remaining = self._split_textbox(elem, available)
@@ -143,7 +354,7 @@ class TemplateExporter:
                     else:
                         dy = local_y - elem.y
                         elem.y = local_y
-                        if elem.type == ElementType.LINE:
+                        if elem.type == _LINE:
                             elem.props["y2"] = elem.props.get("y2", elem.y) + dy
                             elem.props["x2"] = elem.props.get("x2", elem.x) # x remains the same for simple move
                         pages[start_page_idx].append(elem)
@@ -151,79 +362,55 @@ class TemplateExporter:
                 # Fits entirely on its starting page
                 dy = local_y - elem.y
                 elem.y = local_y
-                if elem.type == ElementType.LINE:
+                if elem.type == _LINE:
                     elem.props["y2"] = elem.props.get("y2", elem.y) + dy
                     elem.props["x2"] = elem.props.get("x2", elem.x) # x remains the same for simple move
                 pages[start_page_idx].append(elem)
         
         return pages if pages else [[]]
 
-    def _split_table(self, elem: BaseElement, available_height: float):
+    def _split_table(self, elem: BaseElement, available_height: float, page_capacity: float):
         """
-        Split a table element into two parts based on available height.
+        Split a table element into per-page parts.
+        
+        Args:
+            elem: The table element (must have data rows)
+            available_height: Space left on the page where the table starts
+            page_capacity: Space on each following page, below the top margin
         
         Returns:
-            (first_part, remaining_part) - Either can be None
+            List of (page_offset, part) - page_offset is relative to the start page
         """
-        import copy
-        
         row_height = elem.props.get("row_height", 20.0)
         data = elem.props.get("data", [])
         
-        if not data or available_height < row_height:
-            # Not enough space for even one row, move entire table to next page
-            return None, elem
+        # Parts reference the source rows by slice bounds rather than copying them
+        parts = []
+        for page_offset, first_row, end_row in _plan_table_splits(len(data), row_height, available_height, page_capacity):
+            part = _SplitView(elem, elem.y, (end_row - first_row) * row_height, data_slice=(first_row, end_row))
+            parts.append((page_offset, part))
         
-        # Calculate how many rows fit
-        rows_that_fit = int(available_height / row_height)
-        
-        if rows_that_fit >= len(data):
-            # All rows fit
-            return elem, None
-        
-        # Split the data
-        first_part_data = data[:rows_that_fit]
-        remaining_data = data[rows_that_fit:]
-        
-        # Create first part
-        first_elem = copy.deepcopy(elem)
-        first_elem.props["data"] = first_part_data
-        first_elem.height = rows_that_fit * row_height
-        
-        # Create remaining part
-        remaining_elem = copy.deepcopy(elem)
-        remaining_elem.props["data"] = remaining_data
-        remaining_elem.height = len(remaining_data) * row_height
-        
-        return first_elem, remaining_elem
+        return parts
 
     def _split_textbox(self, elem: BaseElement, available_height: float):
         """
         Split a text box element into two parts based on available height.
         
-        Uses ReportLab's stringWidth for accurate text measurement.
+        Uses ReportLab font metrics (via _wrap_paragraph) for accurate text measurement.
         
         Returns:
             (first_part, remaining_part) - Either can be None
         """
-        import copy
-        from reportlab.pdfbase.pdfmetrics import stringWidth
-        from doclayout.adapters.reportlab.font_helper import FontHelper
-        
-        font_size = elem.props.get("font_size", 12)
-        font_family = elem.props.get("font_family", "Helvetica")
-        bold = elem.props.get("font_bold", False)
-        italic = elem.props.get("font_italic", False)
+        props = elem.props
+        font_size = props.get("font_size", 12)
         
-        # Resolve font name
-        try:
-            font_name = FontHelper.resolve(font_family, bold, italic)
-        except:
-            font_name = "Helvetica"
+        # Font name resolved by _resolve_fonts before pagination
+        font_name = props.get("_resolved_font") or _resolve_font(
+            props.get("font_family", "Helvetica"), props.get("font_bold", False), props.get("font_italic", False))
         
         line_height_mm = font_size * 1.2 / 2.83465  # Convert pt to mm
         
-        text = elem.props.get("text", "")
+        text = props.get("text", "")
         if not text or available_height < line_height_mm:
             # Not enough space for even one line, move to next page
             return None, elem
@@ -234,17 +421,17 @@ class TemplateExporter:
         # Convert width to points for stringWidth
         width_pt = mm_to_pt(elem.width)
         
-        # Use simpleSplit for consistent wrapping
-        from reportlab.lib.utils import simpleSplit
-        
-        # simpleSplit does NOT handle newlines, so we must split manually first
-        paragraphs = text.split('\n')
-        lines = []
-        for p in paragraphs:
-            if not p:
-                lines.append('')  # Keep empty lines
-                continue
-            lines.extend(simpleSplit(p, font_name, font_size, width_pt))
+        # Wrap paragraph by paragraph so explicit newlines are preserved.
+        # Single-paragraph text (the common case) is wrapped directly.
+        if '\n' in text:
+            lines = []
+            for p in text.split('\n'):
+                if not p:
+                    lines.append('')  # Keep empty lines
+                    continue
+                lines.extend(_wrap_paragraph(p, font_name, font_size, width_pt))
+        else:
+            lines = _wrap_paragraph(text, font_name, font_size, width_pt)
         
         # Check if all lines fit
         if len(lines) <= lines_that_fit:
@@ -258,15 +445,17 @@ class TemplateExporter:
         first_part_lines = lines[:lines_that_fit]
         remaining_lines = lines[lines_that_fit:]
         
+        # Parts share the source element and only carry their own text.
+        # A remaining part may be split again, so always point at the original.
+        src = elem.src if isinstance(elem, _SplitView) else elem
+        
         # Create first part - join with newlines to preserve line structure
-        first_elem = copy.deepcopy(elem)
-        first_elem.props["text"] = "\n".join(first_part_lines)
-        first_elem.height = lines_that_fit * line_height_mm
+        first_elem = _SplitView(src, elem.y, lines_that_fit * line_height_mm,
+                                text="\n".join(first_part_lines))
         
         # Create remaining part - join with newlines to preserve line structure
-        remaining_elem = copy.deepcopy(elem)
-        remaining_elem.props["text"] = "\n".join(remaining_lines)
-        remaining_elem.height = len(remaining_lines) * line_height_mm
+        remaining_elem = _SplitView(src, elem.y, len(remaining_lines) * line_height_mm,
+                                    text="\n".join(remaining_lines))
         
         return first_elem, remaining_elem
 
@@ -275,6 +464,10 @@ class TemplateExporter:
         Calculate dynamic heights for tables and text boxes, and adjust positions of elements below them.
         Uses a strictly-below logic to allow columns to function correctly.
         """
+        # Local aliases keep the per-element type checks cheap
+        _TABLE = ElementType.TABLE
+        _TEXT_BOX = ElementType.TEXT_BOX
+
         # 1. Pre-calculate original geometries to determine "below" relationship
         # We attach temporary attributes to elements to track state
         for elem in elements:
@@ -290,7 +483,7 @@ class TemplateExporter:
         for elem in sorted_elements:
             height_delta = 0.0
             
-            if elem.type == ElementType.TABLE:
+            if elem.type == _TABLE:
                 data = elem.props.get("data", [])
                 if data:
                     if "base_height" not in elem.props:
@@ -308,7 +501,7 @@ class TemplateExporter:
                     height_delta = new_height - elem.height
                     elem.height = new_height
                     
-            elif elem.type == ElementType.TEXT_BOX:
+            elif elem.type == _TEXT_BOX:
                 if "base_height" not in elem.props:
                     elem.props["base_height"] = elem.height
                     
@@ -319,7 +512,7 @@ class TemplateExporter:
                 italic = elem.props.get("font_italic", False)
                 
                 # Padding handling (1.0mm visual padding)
-                padding_mm = 1.0 if (elem.props.get("show_outline", False) or elem.props.get("fill_color")) else 0.0
+                padding_mm = TEXT_BOX_PADDING_MM if (elem.props.get("show_outline", False) or elem.props.get("fill_color")) else 0.0
                 content_width = elem.width - (padding_mm * 2)
                 
                 if content_width > 0:
@@ -340,15 +533,20 @@ class TemplateExporter:
                     if victim._orig_y >= (grower_bottom - 0.1):
                          victim._y_offset += height_delta
         
-        # 4. Apply accumulated offsets
+        # 4. Apply accumulated offsets, tracking the lowest bottom edge for export()
+        content_bottom = 0.0
         for elem in elements:
             elem.y += elem._y_offset
+            bottom = elem.y + elem.height
+            if bottom > content_bottom:
+                content_bottom = bottom
             # Cleanup temporary attributes
             del elem._orig_y
             del elem._orig_height
             del elem._orig_bottom
             del elem._y_offset
-            
+        
+        self._content_bottom = content_bottom
         return elements
 
     def _calculate_text_height(self, text: str, font_family: str, font_size: float, 
@@ -367,40 +565,21 @@ class TemplateExporter:
         Returns:
             Height in mm needed to render the text
         """
-        from reportlab.pdfbase.pdfmetrics import stringWidth
-        from doclayout.adapters.reportlab.font_helper import FontHelper
-        
         # Convert width to points for ReportLab
         width_pt = mm_to_pt(width_mm)
         
         # Resolve font name
-        resolved_font = FontHelper.resolve(font_family, bold, italic)
+        resolved_font = _resolve_font(font_family, bold, italic)
         
-        # Split text into words for wrapping calculation
-        words = text.split()
-        if not words:
+        # Wrap the words greedily to count the lines needed
+        if not text.strip():
             return font_size * 1.2 / 2.83465  # One line height in mm
         
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            try:
-                line_width = stringWidth(test_line, resolved_font, font_size)
-            except (KeyError, ValueError, AttributeError):
-                # Fallback to Helvetica if font not found
-                line_width = stringWidth(test_line, "Helvetica", font_size)
-            
-            if line_width <= width_pt:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        
-        if current_line:
-            lines.append(current_line)
+        try:
+            lines = _wrap_paragraph(text, resolved_font, font_size, width_pt)
+        except (KeyError, ValueError, AttributeError):
+            # Fallback to Helvetica if font not found
+            lines = _wrap_paragraph(text, "Helvetica", font_size, width_pt)
         
         # Calculate total height
         line_height_pt = font_size * 1.2  # Standard line spacing
@@ -409,142 +588,153 @@ class TemplateExporter:
         # Convert back to mm
         return total_height_pt / 2.83465
 
+    def _plan_elements(self, elements: List[BaseElement]) -> List[DrawOp]:
+        """
+        Collect the draw operations for a page's elements, in paint order.
+        """
+        recorder = _DrawRecorder()
+        # Handler table and mm -> pt factor bound to locals for the per-element loop
+        handlers = self._handlers
+        k = MM_TO_PT
+        for elem in elements:
+            if isinstance(elem, _SplitView):
+                elem = elem.materialize()
+            handler = handlers.get(elem.type)
+            if handler is not None:
+                handler(elem, recorder, elem.x * k, elem.y * k, elem.width * k, elem.height * k)
+        return recorder.ops
 
+    def _render_rect(self, elem: BaseElement, renderer: Renderer, x: float, y: float, w: float, h: float):
+        stroke = "black" if elem.props.get("show_outline", False) else None
+        stroke_w = elem.props.get("stroke_width", 1.0)
+        renderer.draw_rect(x, y, w, h, stroke_color=stroke, stroke_width=stroke_w)
 
+    def _render_text(self, elem: BaseElement, renderer: Renderer, x: float, y: float, w: float, h: float):
+        font_name = elem.props.get("font_family", "Helvetica")
+        font_size = elem.props.get("font_size", 12)
+        color = elem.props.get("color", "black")
+        align = elem.props.get("text_align", "left")
+        bold = elem.props.get("font_bold", False)
+        italic = elem.props.get("font_italic", False)
+        renderer.draw_text(x, y, elem.props.get("text", ""), 
+                           font_name=font_name, font_size=font_size, 
+                           color=color, alignment=align, width=w,
+                           bold=bold, italic=italic, wrap=True)
 
-    def _render_element(self, elem: BaseElement, renderer: Renderer):
-        x = mm_to_pt(elem.x)
-        y = mm_to_pt(elem.y)
-        w = mm_to_pt(elem.width)
-        h = mm_to_pt(elem.height)
-        
-        if elem.type == ElementType.RECT:
-            stroke = "black" if elem.props.get("show_outline", False) else None
-            stroke_w = elem.props.get("stroke_width", 1.0)
-            renderer.draw_rect(x, y, w, h, stroke_color=stroke, stroke_width=stroke_w)
-        elif elem.type == ElementType.TEXT:
-            font_name = elem.props.get("font_family", "Helvetica")
-            font_size = elem.props.get("font_size", 12)
-            color = elem.props.get("color", "black")
-            align = elem.props.get("text_align", "left")
-            bold = elem.props.get("font_bold", False)
-            italic = elem.props.get("font_italic", False)
-            renderer.draw_text(x, y, elem.props.get("text", ""), 
-                               font_name=font_name, font_size=font_size, 
-                               color=color, alignment=align, width=w,
-                               bold=bold, italic=italic, wrap=True)
-        elif elem.type == ElementType.TEXT_BOX:
-            # Render background/border
-            bg_color = elem.props.get("fill_color", None)
-            show_outline = elem.props.get("show_outline", False)
-            stroke_color = elem.props.get("stroke_color", "black") if show_outline else None
-            stroke_width = float(elem.props.get("stroke_width", 1.0))
-            
-            if bg_color or show_outline:
-                renderer.draw_rect(x, y, w, h, stroke_color=stroke_color, fill_color=bg_color, stroke_width=stroke_width)
-
-            # Render text with padding
-            font_name = elem.props.get("font_family", "Helvetica")
-            font_size = elem.props.get("font_size", 12)
-            color = elem.props.get("color", "black")
-            align = elem.props.get("text_align", "left")
-            bold = elem.props.get("font_bold", False)
-            italic = elem.props.get("font_italic", False)
-            
-            # Use 1.0mm padding consistent with Editor
-            padding_pt = mm_to_pt(1.0)
-            text_x = x + padding_pt
-            text_y = y + padding_pt
-            text_w = w - (padding_pt * 2) if w > (padding_pt * 2) else w
-            
-            renderer.draw_text(text_x, text_y, elem.props.get("text", ""), 
-                               font_name=font_name, font_size=font_size, 
-                               color=color, alignment=align, width=text_w,
-                               bold=bold, italic=italic, wrap=True)
-        elif elem.type == ElementType.IMAGE:
-            renderer.draw_image(x, y, w, h, elem.props.get("image_path", ""))
-        elif elem.type == ElementType.LINE:
-            x2 = mm_to_pt(elem.props.get("x2", 0))
-            y2 = mm_to_pt(elem.props.get("y2", 0))
-            renderer.draw_line(x, y, x2, y2)
-        elif elem.type == ElementType.KV_BOX:
-            props = elem.props
-            stype = props.get("split_type", "ratio")
-            
-            font_family = props.get("font_family", "Helvetica")
-            font_size = props.get("font_size", 10)
-            bold = props.get("font_bold", False)
-            italic = props.get("font_italic", False)
-            
-            if stype == "fixed":
-                split = mm_to_pt(props.get("split_fixed", 20.0))
-            elif stype == "auto":
-                # Auto logic: measure key text
-                rl_font = FontHelper.resolve(font_family, bold, italic)
-                key_txt = props.get("key_text", "Label:")
-                try:
-                    txt_w = stringWidth(key_txt, rl_font, font_size)
-                except (KeyError, ValueError, AttributeError):
-                    # Fallback to Helvetica if font not found or invalid
-                    txt_w = stringWidth(key_txt, "Helvetica", font_size)
-                
-                # Add padding for better visual spacing
-                split = txt_w + mm_to_pt(KV_BOX_PADDING_MM)
-            else: # ratio
-                ratio = props.get("split_ratio", 0.4)
-                split = w * ratio
-
-            show_outline = props.get("show_outline", True)
-            stroke_w = props.get("stroke_width", 0.5)
-            border_color = props.get("border_color", "black")
-            divider_color = props.get("divider_color", "black")
-
-            # Outer rect
-            if show_outline:
-                renderer.draw_rect(x, y, w, h, stroke_color=border_color, stroke_width=stroke_w)
-                # Split line
-                renderer.draw_line(x + split, y, x + split, y + h, color=divider_color, stroke_width=stroke_w)
-            
-            color = props.get("color", "black")
-            v_offset = (h - font_size) / 2
-            
-            # Key Label
-            renderer.draw_text(x + mm_to_pt(KV_BOX_TEXT_PADDING_MM), y + v_offset, props.get("key_text", "Label:"), 
-                               font_name=font_family, font_size=font_size, color=color,
-                               width=split - mm_to_pt(KV_BOX_TEXT_PADDING_MM), bold=bold, italic=italic, wrap=True, auto_scale=True)
-            
-            # Value Label
-            renderer.draw_text(x + split + mm_to_pt(KV_BOX_TEXT_PADDING_MM), y + v_offset, props.get("text", "[Value]"), 
-                               font_name=font_family, font_size=font_size, color=color,
-                               width=w - split - mm_to_pt(KV_BOX_TEXT_PADDING_MM), bold=bold, italic=italic, wrap=True, auto_scale=True)
-                               
-        elif elem.type == ElementType.CONTAINER:
-            # Draw container background and border like a rectangle
-            props = elem.props
-            bg_type = props.get("bg_type", "transparent")
-            show_outline = props.get("show_outline", False)
-            
-            fill = props.get("fill_color", "#ffffff") if bg_type == "solid" else None
-            stroke = props.get("stroke_color", "black") if show_outline else None
-            stroke_w = props.get("stroke_width", 1.0)
-            
-            # Note: Container might also have opacity/alpha, but renderer_api doesn't 
-            # currently expose it directly in draw_rect. We keep it simple.
-            if fill or stroke:
-                renderer.draw_rect(x, y, w, h, stroke_color=stroke, fill_color=fill, stroke_width=stroke_w)
-            
-            # Children are already flattened by LayoutEngine, so we don't need to recursively render here.
-            pass
-
-        elif elem.type == ElementType.TABLE:
-            data = elem.props.get("data", [])
-            # Also pass new style props
-            theme = elem.props.get("theme", "Grid")
-            header_bg = elem.props.get("header_bg_color", None)
-            stroke_col = elem.props.get("stroke_color", "black")
+    def _render_text_box(self, elem: BaseElement, renderer: Renderer, x: float, y: float, w: float, h: float):
+        # Render background/border
+        bg_color = elem.props.get("fill_color", None)
+        show_outline = elem.props.get("show_outline", False)
+        stroke_color = elem.props.get("stroke_color", "black") if show_outline else None
+        stroke_width = float(elem.props.get("stroke_width", 1.0))
+        
+        if bg_color or show_outline:
+            renderer.draw_rect(x, y, w, h, stroke_color=stroke_color, fill_color=bg_color, stroke_width=stroke_width)
+
+        # Render text with padding
+        font_name = elem.props.get("font_family", "Helvetica")
+        font_size = elem.props.get("font_size", 12)
+        color = elem.props.get("color", "black")
+        align = elem.props.get("text_align", "left")
+        bold = elem.props.get("font_bold", False)
+        italic = elem.props.get("font_italic", False)
+        
+        # Use 1.0mm padding consistent with Editor
+        padding_pt = _TEXT_BOX_PADDING_PT
+        text_x = x + padding_pt
+        text_y = y + padding_pt
+        text_w = w - (padding_pt * 2) if w > (padding_pt * 2) else w
+        
+        renderer.draw_text(text_x, text_y, elem.props.get("text", ""), 
+                           font_name=font_name, font_size=font_size, 
+                           color=color, alignment=align, width=text_w,
+                           bold=bold, italic=italic, wrap=True)
+
+    def _render_image(self, elem: BaseElement, renderer: Renderer, x: float, y: float, w: float, h: float):
+        renderer.draw_image(x, y, w, h, elem.props.get("image_path", ""))
+
+    def _render_line(self, elem: BaseElement, renderer: Renderer, x: float, y: float, w: float, h: float):
+        x2 = elem.props.get("x2", 0) * MM_TO_PT
+        y2 = elem.props.get("y2", 0) * MM_TO_PT
+        renderer.draw_line(x, y, x2, y2)
+
+    def _render_kv_box(self, elem: BaseElement, renderer: Renderer, x: float, y: float, w: float, h: float):
+        props = elem.props
+        stype = props.get("split_type", "ratio")
+        
+        font_family = props.get("font_family", "Helvetica")
+        font_size = props.get("font_size", 10)
+        bold = props.get("font_bold", False)
+        italic = props.get("font_italic", False)
+        
+        if stype == "fixed":
+            split = props.get("split_fixed", 20.0) * MM_TO_PT
+        elif stype == "auto":
+            # Auto logic: measure key text
+            rl_font = props.get("_resolved_font") or _resolve_font(font_family, bold, italic)
+            key_txt = props.get("key_text", "Label:")
+            try:
+                txt_w = _text_width(key_txt, rl_font, font_size)
+            except (KeyError, ValueError, AttributeError):
+                # Fallback to Helvetica if font not found or invalid
+                txt_w = stringWidth(key_txt, "Helvetica", font_size)
             
-            renderer.draw_table(x, y, w, h, data, 
-                                font_size=elem.props.get("font_size", 10),
-                                theme=theme,
-                                fill_color_header=header_bg,
-                                stroke_color=stroke_col)
+            # Add padding for better visual spacing
+            split = txt_w + _KV_BOX_PADDING_PT
+        else: # ratio
+            ratio = props.get("split_ratio", 0.4)
+            split = w * ratio
+
+        show_outline = props.get("show_outline", True)
+        stroke_w = props.get("stroke_width", 0.5)
+        border_color = props.get("border_color", "black")
+        divider_color = props.get("divider_color", "black")
+
+        # Outer rect
+        if show_outline:
+            renderer.draw_rect(x, y, w, h, stroke_color=border_color, stroke_width=stroke_w)
+            # Split line
+            renderer.draw_line(x + split, y, x + split, y + h, color=divider_color, stroke_width=stroke_w)
+        
+        color = props.get("color", "black")
+        v_offset = (h - font_size) / 2
+        
+        # Key Label
+        renderer.draw_text(x + _KV_BOX_TEXT_PADDING_PT, y + v_offset, props.get("key_text", "Label:"), 
+                           font_name=font_family, font_size=font_size, color=color,
+                           width=split - _KV_BOX_TEXT_PADDING_PT, bold=bold, italic=italic, wrap=True, auto_scale=True)
+        
+        # Value Label
+        renderer.draw_text(x + split + _KV_BOX_TEXT_PADDING_PT, y + v_offset, props.get("text", "[Value]"), 
+                           font_name=font_family, font_size=font_size, color=color,
+                           width=w - split - _KV_BOX_TEXT_PADDING_PT, bold=bold, italic=italic, wrap=True, auto_scale=True)
+
+    def _render_container(self, elem: BaseElement, renderer: Renderer, x: float, y: float, w: float, h: float):
+        # Draw container background and border like a rectangle
+        props = elem.props
+        bg_type = props.get("bg_type", "transparent")
+        show_outline = props.get("show_outline", False)
+        
+        fill = props.get("fill_color", "#ffffff") if bg_type == "solid" else None
+        stroke = props.get("stroke_color", "black") if show_outline else None
+        stroke_w = props.get("stroke_width", 1.0)
+        
+        # Note: Container might also have opacity/alpha, but renderer_api doesn't 
+        # currently expose it directly in draw_rect. We keep it simple.
+        if fill or stroke:
+            renderer.draw_rect(x, y, w, h, stroke_color=stroke, fill_color=fill, stroke_width=stroke_w)
+        
+        # Children are already flattened by LayoutEngine, so we don't need to recursively render here.
+
+    def _render_table(self, elem: BaseElement, renderer: Renderer, x: float, y: float, w: float, h: float):
+        data = elem.props.get("data", [])
+        # Also pass new style props
+        theme = elem.props.get("theme", "Grid")
+        header_bg = elem.props.get("header_bg_color", None)
+        stroke_col = elem.props.get("stroke_color", "black")
+        
+        renderer.draw_table(x, y, w, h, data, 
+                            font_size=elem.props.get("font_size", 10),
+                            theme=theme,
+                            fill_color_header=header_bg,
+                            stroke_color=stroke_col)
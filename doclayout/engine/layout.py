@@ -3,11 +3,17 @@ Layout Engine.
 Responsible for compiling a Template into a list of absolute renderable elements.
 """
 
-import copy
 import re
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Optional, Union
 from doclayout.core.models import Template, BlockBase, BlockInstance, BaseElement, ElementType
 
+# Simple regex for {{ key }}
+# Handles {{key}} and {{ key }}
+_VAR_RE = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+# Marks a block id that has not been looked up yet in _block_cache
+_MISSING = object()
+
 class LayoutEngine:
     """
     The Layout Engine processes a Template and produces a list of resolved elements.
@@ -19,6 +25,8 @@ class LayoutEngine:
             block_provider: A dictionary mapping block_id to BlockBase objects.
         """
         self.block_provider = block_provider
+        # Per-compile lookup cache, including misses (stored as None)
+        self._block_cache: Dict[str, Optional[BlockBase]] = {}
 
     def compile(self, template: Template) -> List[BaseElement]:
         """
@@ -31,78 +39,97 @@ class LayoutEngine:
             List[BaseElement]: A flat list of elements ready for rendering.
         """
         output_elements: List[BaseElement] = []
+        # The provider may change between compiles; only reuse lookups within one
+        self._block_cache.clear()
+        
+        # Global variables for property bindings, applied as elements are emitted
+        variables = getattr(template, "variables", None)
 
         for item in template.items:
             if isinstance(item, BlockInstance):
-                resolved = self._resolve_block(item)
+                resolved = self._resolve_block(item, variables)
                 output_elements.extend(resolved)
             elif isinstance(item, BaseElement):
                 # Flatten the hierarchy starting from this root element
                 # Root elements are relative to the page (0,0)
-                output_elements.extend(self._flatten_tree(item, 0, 0))
+                self._flatten_into(item, 0, 0, output_elements, variables)
             else:
                 # Should not happen if types are correct
                 pass
-        
-        if hasattr(template, "variables"):
-             self.apply_bindings(output_elements, template.variables)
              
         return output_elements
 
     def apply_bindings(self, elements: List[BaseElement], variables: Dict[str, Any]):
         """Apply property bindings from global variables."""
         for elem in elements:
-            for binding in elem.bindings:
-                if binding.variable_name in variables:
-                    elem.props[binding.target_property] = variables[binding.variable_name]
+            self._apply_element_bindings(elem, variables)
 
-    def _resolve_block(self, instance: BlockInstance) -> List[BaseElement]:
+    @staticmethod
+    def _apply_element_bindings(element: BaseElement, variables: Dict[str, Any]) -> None:
+        """Apply a single element's property bindings from global variables."""
+        for binding in element.bindings:
+            if binding.variable_name in variables:
+                element.props[binding.target_property] = variables[binding.variable_name]
+
+    def _resolve_block(self, instance: BlockInstance,
+                       variables: Optional[Dict[str, Any]] = None) -> List[BaseElement]:
         """
         Resolve a block instance into a list of elements.
         """
-        block_def = self.block_provider.get(instance.block_id)
-        if not block_def:
-            # Log warning or error? For now, skip.
+        block_def = self._block_cache.get(instance.block_id, _MISSING)
+        if block_def is _MISSING:
+            block_def = self.block_provider.get(instance.block_id)
+            self._block_cache[instance.block_id] = block_def
+        if not block_def or not block_def.elements:
+            # Unknown or empty block: nothing to emit. Log warning or error? For now, skip.
             return []
 
-        resolved_elements = []
+        resolved_elements: List[BaseElement] = []
         for elem in block_def.elements:
             # Flatten each potentially hierarchical element in the block
             # Offsets are instance positions
-            flattened = self._flatten_tree(elem, instance.x, instance.y)
-            
-            for flat in flattened:
-                # Apply variable substitution to ALL resulting elements
-                if flat.type == ElementType.TEXT:
-                    self._substitute_text(flat, instance.data)
-                resolved_elements.append(flat)
+            self._flatten_into(elem, instance.x, instance.y, resolved_elements)
+        
+        # Apply variable substitution to ALL resulting elements that have placeholders,
+        # then global bindings (which take precedence over substituted text)
+        # Static blocks (no instance data) without bindings need no pass at all
+        data = instance.data
+        if data or variables:
+            for flat in resolved_elements:
+                if data and flat.type == ElementType.TEXT and "{{" in (flat.props.get("text") or ""):
+                    self._substitute_text(flat, data)
+                if variables and flat.bindings:
+                    self._apply_element_bindings(flat, variables)
             
         return resolved_elements
 
-    def _flatten_tree(self, element: BaseElement, offset_x: float, offset_y: float) -> List[BaseElement]:
+    def _flatten_into(self, root: BaseElement, offset_x: float, offset_y: float,
+                      output: List[BaseElement],
+                      variables: Optional[Dict[str, Any]] = None) -> None:
         """
-        Recursively flatten an element and its children into a list of absolute elements.
+        Flatten an element and its descendants into `output` as absolute elements.
+        Walks the tree with an explicit stack, emitting elements in pre-order.
+        Property bindings are applied from `variables`, if given, as each element is emitted.
         """
-        # Calculate absolute position for this element
-        # element.x/y are relative to parent
-        abs_x = offset_x + element.x
-        abs_y = offset_y + element.y
-        
-        # Create a deep copy to ensure we don't mutate the original template or block definition
-        # We strip children from the copy to create a "flat" element for rendering
-        flat_elem = copy.deepcopy(element)
-        flat_elem.x = abs_x
-        flat_elem.y = abs_y
-        flat_elem.children = [] # Remove hierarchy from the flat list item
-        
-        result = [flat_elem]
-        
-        # Process children
-        # Child coordinates are relative to the parent's new absolute position (top-left)
-        for child in element.children:
-            result.extend(self._flatten_tree(child, abs_x, abs_y))
+        stack = [(root, offset_x, offset_y)]
+        while stack:
+            element, parent_x, parent_y = stack.pop()
             
-        return result
+            # element.x/y are relative to parent
+            abs_x = parent_x + element.x
+            abs_y = parent_y + element.y
+            
+            # Clone so we don't mutate the original template or block definition
+            # The clone has no children, making it a "flat" element for rendering
+            flat_elem = element.clone_flat(abs_x, abs_y)
+            if variables and flat_elem.bindings:
+                self._apply_element_bindings(flat_elem, variables)
+            output.append(flat_elem)
+            
+            # Child coordinates are relative to the parent's new absolute position (top-left)
+            # Pushed in reverse so the first child is processed first
+            for child in reversed(element.children):
+                stack.append((child, abs_x, abs_y))
 
     def _substitute_text(self, element: BaseElement, data: Dict[str, Any]) -> None:
         """
@@ -114,13 +141,13 @@ class LayoutEngine:
         if not text_content:
             return
 
-        # Simple regex for {{ key }}
-        # Handles {{key}} and {{ key }}
-        pattern = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+        # Nothing to substitute: skip the regex pass entirely
+        if not data or "{{" not in text_content:
+            return
         
         def replacer(match):
             key = match.group(1)
             return str(data.get(key, f"{{{{{key}}}}}")) # Keep original if not found
 
-        new_text = pattern.sub(replacer, text_content)
+        new_text = _VAR_RE.sub(replacer, text_content)
         element.props["text"] = new_text
@@ -1,54 +1,59 @@
 """
-Abstract Base Class for the Renderer.
-Defines the interface that any PDF backend must implement.
+Renderer interface.
+Defines the protocol that any PDF backend must implement.
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional
+from abc import abstractmethod
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 
-class Renderer(ABC):
+# A deferred draw call: (method_name, args, kwargs), e.g. ("draw_rect", (x, y, w, h), {})
+DrawOp = Tuple[str, Tuple[Any, ...], Dict[str, Any]]
+
+class Renderer(Protocol):
     """
-    Abstract interface for rendering 2D graphics.
+    Interface for rendering 2D graphics.
     All coordinates should be provided in points (pt).
+    Backends may subclass it explicitly (missing methods then fail at instantiation)
+    or simply provide the same methods; the exporter does not require draw_batch.
     """
 
     @abstractmethod
     def set_page_size(self, width: float, height: float) -> None:
         """Set the dimensions of the current page."""
-        pass
+        ...
 
     @abstractmethod
     def initialize(self, output_path: str) -> None:
         """Initialize the renderer with output path."""
-        pass
+        ...
 
     @abstractmethod
     def start_page(self) -> None:
         """Start a new page."""
-        pass
+        ...
 
     @abstractmethod
     def end_page(self) -> None:
         """Finish the current page."""
-        pass
+        ...
 
     @abstractmethod
     def draw_rect(self, x: float, y: float, width: float, height: float, 
                   stroke_color: Optional[str] = None, 
                   fill_color: Optional[str] = None, stroke_width: float = 1.0) -> None:
         """Draw a rectangle."""
-        pass
+        ...
 
     @abstractmethod
     def draw_line(self, x1: float, y1: float, x2: float, y2: float, 
                   color: str = "black", stroke_width: float = 1.0) -> None:
         """Draw a line."""
-        pass
+        ...
     
     @abstractmethod
     def draw_image(self, x: float, y: float, width: float, height: float, path: str) -> None:
         """Draw an image."""
-        pass
+        ...
 
     @abstractmethod
     def draw_text(self, x: float, y: float, text: str, 
@@ -58,7 +63,7 @@ class Renderer(ABC):
                   bold: bool = False, italic: bool = False,
                   wrap: bool = False, auto_scale: bool = False) -> None:
         """Draw text."""
-        pass
+        ...
 
     @abstractmethod
     def draw_table(self, x: float, y: float, width: float, height: float, 
@@ -69,9 +74,17 @@ class Renderer(ABC):
                    stroke_color: str = "black",
                    fill_color_header: Optional[str] = None) -> None:
         """Draw a table."""
-        pass
+        ...
+
+    def draw_batch(self, ops: List[DrawOp]) -> None:
+        """
+        Execute a list of draw operations in order.
+        Backends may override this to share drawing state across operations.
+        """
+        for name, args, kwargs in ops:
+            getattr(self, name)(*args, **kwargs)
 
     @abstractmethod
     def save(self, file_path: str) -> None:
         """Save the rendered document to a file."""
-        pass
+        ...
@@ -3,8 +3,8 @@ Resize Handle Graphics Item.
 """
 
 from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsItem
-from PySide6.QtCore import Qt, QRectF, QPointF
-from PySide6.QtGui import QBrush, QPen, QColor, QCursor, QPainter
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QBrush, QPen, QColor, QCursor
 
 class ResizeHandle(QGraphicsRectItem):
     """
@@ -21,74 +21,133 @@ class ResizeHandle(QGraphicsRectItem):
     RIGHT = 5
     BOTTOM = 6
     LEFT = 7
+    # Full set, in the order editor items lay them out
+    ALL_POSITIONS = (TOP_LEFT, TOP_RIGHT, BOTTOM_RIGHT, BOTTOM_LEFT, TOP, BOTTOM, LEFT, RIGHT)
+
+    # Minimum milliseconds between applied geometry updates while dragging (~60 Hz)
+    APPLY_INTERVAL_MS = 16
+
+    # Professional look: Semi-transparent White fill, Blue border (Google Blue)
+    _BRUSH = QBrush(QColor(255, 255, 255, 180))
+    _PEN = QPen(QColor("#1a73e8"), 0.3)
+
+    # Position -> QCursor, shared by all handles (see _cursors)
+    _CURSOR_TABLE = None
+
+    # Position -> (sx, sy): how each axis reacts to the drag delta
+    # (+1 grow with delta, -1 move the near edge, 0 unaffected)
+    _RESIZE_MATRIX = {
+        TOP_LEFT: (-1, -1),
+        TOP: (0, -1),
+        TOP_RIGHT: (1, -1),
+        RIGHT: (1, 0),
+        BOTTOM_RIGHT: (1, 1),
+        BOTTOM: (0, 1),
+        BOTTOM_LEFT: (-1, 1),
+        LEFT: (-1, 0),
+    }
+
+    # Position -> (fx, fy): handle center as a fraction of the parent rect
+    _POS_TABLE = {
+        TOP_LEFT: (0.0, 0.0),
+        TOP: (0.5, 0.0),
+        TOP_RIGHT: (1.0, 0.0),
+        RIGHT: (1.0, 0.5),
+        BOTTOM_RIGHT: (1.0, 1.0),
+        BOTTOM: (0.5, 1.0),
+        BOTTOM_LEFT: (0.0, 1.0),
+        LEFT: (0.0, 0.5),
+    }
 
     def __init__(self, position: int, parent: QGraphicsItem):
         super().__init__(0, 0, self.SIZE, self.SIZE, parent)
         self._position = position
         
-        # Professional look: Semi-transparent White fill, Blue border
-        self.setBrush(QBrush(QColor(255, 255, 255, 180)))
-        self.setPen(QPen(QColor("#1a73e8"), 0.3)) # Google Blue
+        self.setBrush(self._BRUSH)
+        self.setPen(self._PEN)
         
-        self.setFlags(QGraphicsItem.ItemIsMovable) 
-        self.setFlag(QGraphicsItem.ItemIsMovable, False)
-        self.setFlag(QGraphicsItem.ItemIsSelectable, False)
+        # Neither movable nor selectable: QGraphicsRectItem's default (no flags)
         
         self.setCursor(self._get_cursor())
         self._update_position()
 
-    def paint(self, painter, option, widget):
-        """Draw as a professional square with antialiasing."""
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setBrush(self.brush())
-        painter.setPen(self.pen())
-        painter.drawRect(self.rect())
+    @classmethod
+    def _cursors(cls):
+        """Shared cursor per position, built on first use (needs a QGuiApplication)."""
+        if ResizeHandle._CURSOR_TABLE is None:
+            fdiag = QCursor(Qt.SizeFDiagCursor)
+            bdiag = QCursor(Qt.SizeBDiagCursor)
+            ver = QCursor(Qt.SizeVerCursor)
+            hor = QCursor(Qt.SizeHorCursor)
+            ResizeHandle._CURSOR_TABLE = {
+                cls.TOP_LEFT: fdiag, cls.BOTTOM_RIGHT: fdiag,
+                cls.TOP_RIGHT: bdiag, cls.BOTTOM_LEFT: bdiag,
+                cls.TOP: ver, cls.BOTTOM: ver,
+                cls.LEFT: hor, cls.RIGHT: hor,
+                None: QCursor(Qt.ArrowCursor),
+            }
+        return ResizeHandle._CURSOR_TABLE
 
     def _get_cursor(self):
-        if self._position in (self.TOP_LEFT, self.BOTTOM_RIGHT):
-            return QCursor(Qt.SizeFDiagCursor)
-        elif self._position in (self.TOP_RIGHT, self.BOTTOM_LEFT):
-            return QCursor(Qt.SizeBDiagCursor)
-        elif self._position in (self.TOP, self.BOTTOM):
-            return QCursor(Qt.SizeVerCursor)
-        elif self._position in (self.LEFT, self.RIGHT):
-            return QCursor(Qt.SizeHorCursor)
-        return QCursor(Qt.ArrowCursor)
-
-    def _update_position(self):
-        parent = self.parentItem()
-        if not parent:
-            return
-            
-        rect = parent.boundingRect()
-        s = self.SIZE
-        
-        if self._position == self.TOP_LEFT:
-            self.setPos(rect.left() - s/2, rect.top() - s/2)
-        elif self._position == self.TOP_RIGHT:
-            self.setPos(rect.right() - s/2, rect.top() - s/2)
-        elif self._position == self.BOTTOM_RIGHT:
-            self.setPos(rect.right() - s/2, rect.bottom() - s/2)
-        elif self._position == self.BOTTOM_LEFT:
-            self.setPos(rect.left() - s/2, rect.bottom() - s/2)
-        elif self._position == self.TOP:
-            self.setPos(rect.center().x() - s/2, rect.top() - s/2)
-        elif self._position == self.BOTTOM:
-            self.setPos(rect.center().x() - s/2, rect.bottom() - s/2)
-        elif self._position == self.LEFT:
-            self.setPos(rect.left() - s/2, rect.center().y() - s/2)
-        elif self._position == self.RIGHT:
-            self.setPos(rect.right() - s/2, rect.center().y() - s/2)
+        cursors = ResizeHandle._cursors()
+        return cursors.get(self._position, cursors[None])
+
+    def _update_position(self, rect=None):
+        """Place the handle on the parent's rect (pass `rect` if already known)."""
+        if rect is None:
+            parent = self.parentItem()
+            if not parent:
+                return
+            rect = parent.boundingRect()
+        fx, fy = self._POS_TABLE[self._position]
+        half = self.SIZE / 2
+        self.setPos(rect.left() + fx * rect.width() - half,
+                    rect.top() + fy * rect.height() - half)
             
     def mousePressEvent(self, event):
         # Start resize - Store reference state
-        self._start_pos = event.scenePos()
-        self._start_item_pos = self.parentItem().pos()
-        self._start_rect = self.parentItem().boundingRect()
+        item = self.parentItem()
+        # Kept as plain floats: the move handler does all its math on scalars
+        start_pos, item_pos, rect = event.scenePos(), item.pos(), item.boundingRect()
+        self._start_mouse = (start_pos.x(), start_pos.y())
+        self._start_geom = (item_pos.x(), item_pos.y(), rect.width(), rect.height())
+        self._pending = None
+        self._moved = False
+        if getattr(self, '_apply_timer', None) is None:
+            # Created on first drag only; handles are built in bulk and most never move
+            self._apply_timer = QTimer()
+            self._apply_timer.setSingleShot(True)
+            self._apply_timer.setTimerType(Qt.PreciseTimer)
+            self._apply_timer.setInterval(self.APPLY_INTERVAL_MS)
+            self._apply_timer.timeout.connect(self._on_apply_timer)
+
+        # Resolve the parent's capabilities once for the whole drag
+        scene = item.scene()
+        self._use_delta = (getattr(item, 'supports_geometry_delta', False)
+                           and hasattr(scene, "begin_delta"))
+        self._set_rect = getattr(item, 'setRect', None)
+        self._model = getattr(item, 'model', None)
+        self._update_handles = getattr(item, 'update_handles', None)
+        self._item_moved = getattr(scene, 'itemMoved', None) if scene else None
+        self._item_moved_live = getattr(scene, 'itemMovedLive', None) if scene else None
+        if hasattr(item, 'begin_resize'):
+            item.begin_resize()
+
+        # Grid settings cannot change mid-drag; keep the reciprocal for snapping
+        if scene:
+            self._grid = scene.alignment.grid_size
+            self._inv_grid = scene.alignment.inv_grid
+            self._snap = scene.alignment.snap_enabled
+        else:
+            self._grid = 5.0
+            self._inv_grid = 0.2
+            self._snap = False
         
-        # Save snapshot BEFORE resize starts
-        if self.scene() and hasattr(self.scene(), "save_snapshot"):
-            self.scene().save_snapshot()
+        # Record the geometry BEFORE resize starts (a small undo delta, not a full snapshot)
+        if self._use_delta:
+            scene.begin_delta("resize", item)
+        elif scene and hasattr(scene, "save_snapshot"):
+            scene.save_snapshot()
             
         event.accept()
 
@@ -98,93 +157,112 @@ class ResizeHandle(QGraphicsRectItem):
             return
             
         pos = event.scenePos()
-        scene = self.scene()
-        if scene and scene.alignment.snap_enabled:
-             pos.setX(round(pos.x() / scene.alignment.grid_size) * scene.alignment.grid_size)
-             pos.setY(round(pos.y() / scene.alignment.grid_size) * scene.alignment.grid_size)
+        px, py = pos.x(), pos.y()
+        if self._snap:
+            g, inv = self._grid, self._inv_grid
+            px = (px * inv + 0.5) // 1 * g
+            py = (py * inv + 0.5) // 1 * g
         
         # Calculate Delta from START position to current SNAPPED position
-        delta = pos - self._start_pos
+        dx = px - self._start_mouse[0]
+        dy = py - self._start_mouse[1]
         
-        # Reference values
-        base_rect = self._start_rect
-        base_pos = self._start_item_pos
+        # Reference values: apply delta to the START state
+        new_x, new_y, base_w, base_h = self._start_geom
+        new_w, new_h = base_w, base_h
         
-        new_rect = QRectF(base_rect)
-        new_pos = QPointF(base_pos)
+        min_size = self._grid
+        sx, sy = self._RESIZE_MATRIX[self._position]
         
-        min_size = scene.alignment.grid_size if scene else 5.0
+        # +1: far edge follows the mouse; -1: near edge follows, moving the item
+        # and keeping the far edge fixed (skipped if it would go below min_size)
+        if sx > 0:
+            new_w = max(min_size, base_w + dx)
+        elif sx < 0 and base_w - dx >= min_size:
+            new_x += dx
+            new_w = base_w - dx
+        if sy > 0:
+            new_h = max(min_size, base_h + dy)
+        elif sy < 0 and base_h - dy >= min_size:
+            new_y += dy
+            new_h = base_h - dy
+
+        # Coalesce to frame rate: apply now if the gate is open, otherwise keep
+        # only the latest geometry for the timer (or release) to apply
+        self._pending = (new_x, new_y, new_w, new_h)
+        if not self._apply_timer.isActive():
+            self._apply_pending()
+            self._apply_timer.start()
         
-        # Fixed logic: Apply delta to the START state
-        if self._position == self.BOTTOM_RIGHT:
-            new_rect.setWidth(max(min_size, base_rect.width() + delta.x()))
-            new_rect.setHeight(max(min_size, base_rect.height() + delta.y()))
-            
-        elif self._position == self.BOTTOM_LEFT:
-            dw = -delta.x()
-            if base_rect.width() + dw >= min_size:
-                new_pos.setX(base_pos.x() + delta.x())
-                new_rect.setWidth(base_rect.width() + dw)
-            new_rect.setHeight(max(min_size, base_rect.height() + delta.y()))
-            
-        elif self._position == self.TOP_RIGHT:
-            dh = -delta.y()
-            if base_rect.height() + dh >= min_size:
-                new_pos.setY(base_pos.y() + delta.y())
-                new_rect.setHeight(base_rect.height() + dh)
-            new_rect.setWidth(max(min_size, base_rect.width() + delta.x()))
-            
-        elif self._position == self.TOP_LEFT:
-            dw, dh = -delta.x(), -delta.y()
-            if base_rect.width() + dw >= min_size:
-                new_pos.setX(base_pos.x() + delta.x())
-                new_rect.setWidth(base_rect.width() + dw)
-            if base_rect.height() + dh >= min_size:
-                new_pos.setY(base_pos.y() + delta.y())
-                new_rect.setHeight(base_rect.height() + dh)
-                
-        elif self._position == self.TOP:
-            dh = -delta.y()
-            if base_rect.height() + dh >= min_size:
-                new_pos.setY(base_pos.y() + delta.y())
-                new_rect.setHeight(base_rect.height() + dh)
-                
-        elif self._position == self.BOTTOM:
-            new_rect.setHeight(max(min_size, base_rect.height() + delta.y()))
-            
-        elif self._position == self.LEFT:
-            dw = -delta.x()
-            if base_rect.width() + dw >= min_size:
-                new_pos.setX(base_pos.x() + delta.x())
-                new_rect.setWidth(base_rect.width() + dw)
-                
-        elif self._position == self.RIGHT:
-            new_rect.setWidth(max(min_size, base_rect.width() + delta.x()))
-            
-        # Apply changes
-        item.setPos(new_pos)
-        if hasattr(item, 'setRect'):
-            item.setRect(0, 0, new_rect.width(), new_rect.height())
+        event.accept()
+
+    def _on_apply_timer(self):
+        if self._pending is not None:
+            self._apply_pending()
+            self._apply_timer.start()
+
+    def _apply_pending(self):
+        """Apply the latest requested geometry to the parent item."""
+        item = self.parentItem()
+        if self._pending is None or not item:
+            return
+        new_x, new_y, new_w, new_h = self._pending
+        self._pending = None
+
+        # Every editor item's setRect repositions its own handles,
+        # so update_handles is only needed for items without one.
+        item.setPos(new_x, new_y)
+        if self._set_rect:
+            self._set_rect(0, 0, new_w, new_h)
+        elif self._update_handles:
+            self._update_handles()
 
         # Sync model
-        if hasattr(item, 'model'):
-            item.model.x = new_pos.x()
-            item.model.y = new_pos.y()
-            item.model.width = new_rect.width()
-            item.model.height = new_rect.height()
-            
-        # Update all handles positions
-        if hasattr(item, 'update_handles'):
-            item.update_handles()
+        model = self._model
+        if model is not None:
+            model.x = new_x
+            model.y = new_y
+            model.width = new_w
+            model.height = new_h
             
-        # Emit move signal
-        if item.scene() and hasattr(item.scene(), "itemMoved"):
-            item.scene().itemMoved.emit(item)
-        
-        event.accept()
+        # Emit live move signal; itemMoved follows once on release
+        self._moved = True
+        if self._item_moved_live is not None:
+            self._item_moved_live.emit(item)
+
+    def _geometry_changed(self, item) -> bool:
+        """True if the parent's pos/rect differ from those at mouse press."""
+        start = getattr(self, '_start_geom', None)
+        if start is None:
+            return True
+        rect, pos = item.boundingRect(), item.pos()
+        x, y, w, h = start
+        return (abs(rect.width() - w) + abs(rect.height() - h)
+                + abs(pos.x() - x) + abs(pos.y() - y)) >= 1e-6
 
     def mouseReleaseEvent(self, event):
-        # Save snapshot AFTER resize ends
-        if self.scene() and hasattr(self.scene(), "save_snapshot"):
-            self.scene().save_snapshot()
+        # Flush geometry that was held back by the frame-rate gate
+        timer = getattr(self, '_apply_timer', None)
+        if timer is not None:
+            timer.stop()
+        if getattr(self, '_pending', None) is not None:
+            self._apply_pending()
+        item = self.parentItem()
+        if item and hasattr(item, 'end_resize'):
+            item.end_resize()
+        if getattr(self, '_moved', False) and item and self._item_moved is not None:
+            self._item_moved.emit(item)
+        self._moved = False
+
+        # Record the geometry AFTER resize ends, unless the drag was a no-op
+        scene = self.scene()
+        if scene and item and self._geometry_changed(item):
+            if getattr(self, '_use_delta', False):
+                scene.commit_delta(item)
+            elif hasattr(scene, "save_snapshot"):
+                scene.save_snapshot()
+        elif scene and hasattr(scene, "discard_delta"):
+            scene.discard_delta()
+        self._set_rect = self._model = self._update_handles = None
+        self._item_moved = self._item_moved_live = None
         super().mouseReleaseEvent(event)
@@ -10,6 +10,20 @@ from .image import ImageEditorItem
 from .line import LineEditorItem, LineHandle
 from .kvbox import KVBoxEditorItem
 from .table import TableEditorItem
+from .container import ContainerEditorItem
+from doclayout.core.models import ElementType
+
+# ElementType -> editor item class, used by get_item_for_model
+_ITEM_CLASSES = {
+    ElementType.RECT: RectEditorItem,
+    ElementType.TEXT: TextEditorItem,
+    ElementType.TEXT_BOX: TextBoxEditorItem,
+    ElementType.IMAGE: ImageEditorItem,
+    ElementType.LINE: LineEditorItem,
+    ElementType.KV_BOX: KVBoxEditorItem,
+    ElementType.CONTAINER: ContainerEditorItem,
+    ElementType.TABLE: TableEditorItem,
+}
 
 def get_item_for_model(model):
     """
@@ -33,27 +47,12 @@ def get_item_for_model(model):
         >>> isinstance(item, TextEditorItem)
         True
     """
-    from doclayout.core.models import ElementType
-    item = None
-    if model.type == ElementType.RECT:
-        item = RectEditorItem(model)
-    elif model.type == ElementType.TEXT:
-        item = TextEditorItem(model)
-    elif model.type == ElementType.TEXT_BOX:
-        item = TextBoxEditorItem(model)
-    elif model.type == ElementType.IMAGE:
-        item = ImageEditorItem(model)
-    elif model.type == ElementType.LINE:
-        item = LineEditorItem(model)
-    elif model.type == ElementType.KV_BOX:
-        item = KVBoxEditorItem(model)
-    elif model.type == ElementType.CONTAINER:
-        from .container import ContainerEditorItem
-        item = ContainerEditorItem(model)
-    elif model.type == ElementType.TABLE:
-        item = TableEditorItem(model)
+    item_cls = _ITEM_CLASSES.get(getattr(model, 'type', None))
+    if item_cls is None:
+        return None
+    item = item_cls(model)
     
-    if item and hasattr(model, 'z'):
+    if hasattr(model, 'z'):
         item.setZValue(model.z)
     
     return item
@@ -1,17 +1,35 @@
 from PySide6.QtWidgets import QGraphicsItem
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QColor, QBrush, QPen
 from doclayout.core.models import BaseElement
+from ..handles import ResizeHandle
+
+# items.get_item_for_model, resolved on first use (the package imports this module)
+_item_factory = None
+
+def _get_item_factory():
+    global _item_factory
+    if _item_factory is None:
+        from . import get_item_for_model
+        _item_factory = get_item_for_model
+    return _item_factory
 
 class BaseEditorItem:
     """Mixin for common editor item functionality."""
+    # Resizes only touch this item's own geometry, so undo can store a GeometryDelta
+    supports_geometry_delta = True
+    # ResizeHandle positions offered by this item; built by update_handles on first show
+    handle_positions = ()
+    _handles = None
+
     def __init__(self, model: BaseElement):
         self.model = model
-        self.setFlag(QGraphicsItem.ItemIsSelectable, True)
-        self.setFlag(QGraphicsItem.ItemIsMovable, True)
-        self.setFlag(QGraphicsItem.ItemIsSelectable, True)
-        self.setFlag(QGraphicsItem.ItemIsMovable, True)
-        self.setFlag(QGraphicsItem.ItemIsFocusable, True)
-        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
+        # One call; keep flags the Qt base class already set (e.g. QGraphicsTextItem)
+        self.setFlags(self.flags()
+                      | QGraphicsItem.ItemIsSelectable
+                      | QGraphicsItem.ItemIsMovable
+                      | QGraphicsItem.ItemIsFocusable
+                      | QGraphicsItem.ItemSendsGeometryChanges)
         
         # Initial locking state
         self.update_locking()
@@ -20,9 +38,12 @@ class BaseEditorItem:
         self._create_children_items()
 
     def _create_children_items(self):
-        from . import get_item_for_model
-        for child_model in self.model.children:
-            child_item = get_item_for_model(child_model)
+        if not self.model.children:
+            return
+        factory = _get_item_factory()
+        # Build every child first, then attach them in one pass
+        child_items = [factory(child_model) for child_model in self.model.children]
+        for child_item in child_items:
             if child_item:
                 child_item.setParentItem(self)
 
@@ -40,12 +61,31 @@ class BaseEditorItem:
                 return
             parent = parent.parentItem()
             
+        # Position changes until release are drag steps (see itemChange). Qt moves
+        # every selected item along with this one, so flag them all.
+        scene = self.scene()
+        group = [self] + [item for item in (scene.selectedItems() if scene else ())
+                          if item is not self and isinstance(item, BaseEditorItem)]
+        for item in group:
+            item._dragging = True
+            item._drag_moved = False
+        self._drag_group = group
         super().mousePressEvent(event)
     
     def mouseReleaseEvent(self, event):
         """Clear alignment guides when mouse is released and save snapshot."""
         super().mouseReleaseEvent(event)
+        group = getattr(self, '_drag_group', None) or [self]
+        self._drag_group = None
+        moved = [item for item in group if getattr(item, '_drag_moved', False)]
+        for item in group:
+            item._dragging = item._drag_moved = False
         if self.scene():
+            # One itemMoved per moved item for the whole drag
+            if hasattr(self.scene(), "itemMoved"):
+                for item in moved:
+                    self.scene().itemMoved.emit(item)
+
             if hasattr(self.scene(), 'alignment'):
                 self.scene().alignment.guide_lines = []
                 self.scene().update()
@@ -56,43 +96,53 @@ class BaseEditorItem:
 
     def itemChange(self, change, value):
         if change == QGraphicsItem.ItemSelectedChange:
-            # value is the new selection state
+            # value is the new selection state; this also positions the handles
             self.update_handles(selected=value)
-            
-            # Legacy single handle update
-            if value and hasattr(self, '_handle') and self._handle:
-                 self._handle._update_position()
-                 
-            # New multiple handles update
-            if value and hasattr(self, '_handles'):
-                for h in self._handles:
-                    h._update_position()
 
-        if change == QGraphicsItem.ItemPositionChange and self.scene():
+        scene = self.scene() if change == QGraphicsItem.ItemPositionChange else None
+        if scene:
             # Respect lock_position
             if self.model.lock_position:
                 return self.pos()
 
             # Snap to grid
-            if hasattr(self.scene(), 'alignment') and self.scene().alignment.snap_enabled:
-                 grid = self.scene().alignment.grid_size
-                 new_pos = value
-                 x = round(new_pos.x() / grid) * grid
-                 y = round(new_pos.y() / grid) * grid
+            align = getattr(scene, 'alignment', None)
+            if align is not None and align.snap_enabled:
+                 grid, inv = align.grid_size, align.inv_grid
+                 x = (value.x() * inv + 0.5) // 1 * grid
+                 y = (value.y() * inv + 0.5) // 1 * grid
                  value = type(value)(x, y)
                  
             # Update model with snapped value
             self.model.x = value.x()
             self.model.y = value.y()
             
-            # Emit moved signal if scene exists
-            if self.scene() and hasattr(self.scene(), "itemMoved"):
-                 self.scene().itemMoved.emit(self)
+            # Emit moved signal if scene exists: live during a drag, itemMoved otherwise
+            if getattr(self, '_dragging', False):
+                self._drag_moved = True
+                if hasattr(scene, "itemMovedLive"):
+                    scene.itemMovedLive.emit(self)
+            elif hasattr(scene, "itemMoved"):
+                scene.itemMoved.emit(self)
 
             return value
 
         return super().itemChange(change, value)
 
+    def flush_pending_edits(self) -> None:
+        """Write any deferred property edits into the model (called before serializing)."""
+
+    def set_pos_silent(self, x: float, y: float) -> None:
+        """
+        Move the item and its model without the itemChange round trip
+        (no snapping, lock check or move signals). For programmatic layout moves.
+        """
+        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, False)
+        self.setPos(x, y)
+        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
+        self.model.x = x
+        self.model.y = y
+
     def update_handles(self, selected=None):
         """Update handles positions and visibility."""
         if not hasattr(self, 'model'):
@@ -102,17 +152,30 @@ class BaseEditorItem:
             selected = self.isSelected()
             
         visible = selected and not self.model.lock_geometry
-            
-        # Legacy single handle
-        if hasattr(self, '_handle') and self._handle:
-            self._handle.setVisible(visible)
-            self._handle._update_position()
-            
-        # New multiple handles
-        if hasattr(self, '_handles') and self._handles:
-            for handle in self._handles:
-                handle.setVisible(visible)
-                handle._update_position()
+
+        # Handles only exist while they are shown, so idle items add no
+        # nodes to the scene index
+        handles = self._handles
+        if not visible:
+            if handles is not None:
+                self._handles = None
+                scene = self.scene()
+                for handle in handles:
+                    if scene is not None:
+                        scene.removeItem(handle)
+                    else:
+                        handle.setParentItem(None)
+            return
+
+        if handles is None:
+            if not self.handle_positions:
+                return
+            handles = self._handles = [ResizeHandle(pos, self) for pos in self.handle_positions]
+
+        # All handles share a single boundingRect() query
+        rect = self.boundingRect()
+        for handle in handles:
+            handle._update_position(rect)
 
     def update_locking(self):
         """Update flags and visuals based on model lock properties."""
@@ -126,9 +189,6 @@ class BaseEditorItem:
         if not (self.model.lock_position or self.model.lock_geometry or self.model.lock_selection):
             return
             
-        from PySide6.QtGui import QColor, QBrush, QPen
-        from PySide6.QtCore import QPointF, Qt
-        
         painter.save()
         s = 2.0 # icon size
         margin = 1.0
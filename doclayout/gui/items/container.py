@@ -2,67 +2,79 @@ from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsItem
 from PySide6.QtCore import Qt, QRectF
 from PySide6.QtGui import QPen, QColor, QBrush
 from .base import BaseEditorItem
+from ..handles import ResizeHandle
 from doclayout.core.models import BaseElement
+from doclayout.core.geometry import PT_TO_MM
+
+# Half-width/height (mm) of the "everything below" region queried during auto-flow
+_FLOW_QUERY_EXTENT = 1.0e6
 
 class ContainerEditorItem(BaseEditorItem, QGraphicsRectItem):
     """
     A container item that groups other items.
     Handles auto-flow logic: moving siblings when resized.
     """
+    # Resize handles, created on first selection
+    handle_positions = ResizeHandle.ALL_POSITIONS
+
+    # Resizing moves siblings too, so undo needs full snapshots
+    supports_geometry_delta = False
+
+    # Guide mode outline (show_outline off), shared by all containers
+    _GUIDE_PEN = QPen(QColor(100, 100, 100))
+    _GUIDE_PEN.setStyle(Qt.DashLine)
+    _GUIDE_PEN.setWidthF(0.2)
+
     def __init__(self, model: BaseElement):
         QGraphicsRectItem.__init__(self, 0, 0, model.width, model.height)
         BaseEditorItem.__init__(self, model)
         
         self.setPos(model.x, model.y)
         self.update()
+
+        # While a handle drag is in progress, auto-flow waits for end_resize()
+        self._in_resize = False
+        self._resize_start_height = model.height
+
+    def _outline_pen(self) -> QPen:
+        """Pen for the current outline props, rebuilt only when they change."""
+        props = self.model.props
+        if not props.get("show_outline", False):
+            return self._GUIDE_PEN
+
+        key = (props.get("stroke_width", 1.0), props.get("stroke_color", "#000000"))
+        if key == getattr(self, '_pen_key', None):
+            return self._pen
+
+        # Set stroke width if enabled
+        width_mm = float(key[0]) * PT_TO_MM
         
-        from ..handles import ResizeHandle
-        self._handles = [
-            ResizeHandle(ResizeHandle.TOP_LEFT, self),
-            ResizeHandle(ResizeHandle.TOP_RIGHT, self),
-            ResizeHandle(ResizeHandle.BOTTOM_RIGHT, self),
-            ResizeHandle(ResizeHandle.BOTTOM_LEFT, self),
-            ResizeHandle(ResizeHandle.TOP, self),
-            ResizeHandle(ResizeHandle.BOTTOM, self),
-            ResizeHandle(ResizeHandle.LEFT, self),
-            ResizeHandle(ResizeHandle.RIGHT, self),
-        ]
-        for h in self._handles:
-            h.setVisible(False)
-        
-        # Track previous height for delta calculation
-        self._last_height = model.height
+        pen = QPen()
+        pen.setColor(QColor(key[1]))
+        pen.setWidthF(width_mm)
+        pen.setStyle(Qt.SolidLine)
+        pen.setCosmetic(False)
+        self._pen_key, self._pen = key, pen
+        return pen
+
+    def _fill_brush(self):
+        """Brush for the current fill props, rebuilt only when they change."""
+        props = self.model.props
+        if props.get("bg_type", "transparent") != "solid":
+            return Qt.NoBrush
+
+        key = (props.get("fill_color", "#ffffff"), props.get("opacity", 255))
+        if key == getattr(self, '_brush_key', None):
+            return self._brush
+
+        color = QColor(key[0])
+        color.setAlpha(key[1])
+        self._brush_key, self._brush = key, QBrush(color)
+        return self._brush
 
     def paint(self, painter, option, widget):
-        # Set stroke width if enabled
-        show_outline = self.model.props.get("show_outline", False)
-        if show_outline:
-            from doclayout.core.geometry import PT_TO_MM
-            width_pt = float(self.model.props.get("stroke_width", 1.0))
-            width_mm = width_pt * PT_TO_MM
-            
-            pen = QPen()
-            stroke_color = self.model.props.get("stroke_color", "#000000")
-            pen.setColor(QColor(stroke_color))
-            pen.setWidthF(width_mm)
-            pen.setStyle(Qt.SolidLine)
-            pen.setCosmetic(False)
-            painter.setPen(pen)
-        else:
-            # Guide mode
-            pen = QPen(QColor(100, 100, 100))
-            pen.setStyle(Qt.DashLine)
-            pen.setWidthF(0.2)
-            painter.setPen(pen)
-
-        # Fill
-        bg_type = self.model.props.get("bg_type", "transparent")
-        if bg_type == "solid":
-            color = QColor(self.model.props.get("fill_color", "#ffffff"))
-            color.setAlpha(self.model.props.get("opacity", 255))
-            painter.setBrush(QBrush(color))
-        else:
-            painter.setBrush(Qt.NoBrush)
+        painter.setPen(self._outline_pen())
+        painter.setBrush(self._fill_brush())
 
         super().paint(painter, option, widget)
         self.paint_lock_icons(painter)
@@ -76,13 +88,27 @@ class ContainerEditorItem(BaseEditorItem, QGraphicsRectItem):
         self.model.height = h
         self.update_handles()
         
-        # Auto-Flow Logic
+        # Auto-Flow Logic: mid-drag this is deferred to end_resize()
+        if self._in_resize:
+            return
         # If height changed, find siblings below and move them
         delta_h = h - old_h
         if abs(delta_h) > 0.1: # Threshold
              self._apply_auto_flow(delta_h)
-             
-        self._last_height = h
+
+    def begin_resize(self):
+        """Called by ResizeHandle on press: defer auto-flow until end_resize()."""
+        self._in_resize = True
+        self._resize_start_height = self.rect().height()
+
+    def end_resize(self):
+        """Called by ResizeHandle on release: auto-flow once for the whole drag."""
+        if not self._in_resize:
+            return
+        self._in_resize = False
+        delta_h = self.rect().height() - self._resize_start_height
+        if abs(delta_h) > 0.1: # Threshold
+            self._apply_auto_flow(delta_h)
 
     def _apply_auto_flow(self, delta_h):
         """
@@ -92,37 +118,32 @@ class ContainerEditorItem(BaseEditorItem, QGraphicsRectItem):
         if not scene:
             return
             
-        my_y = self.scenePos().y() if self.scenePos() else self.model.y
-        old_bottom = my_y + (self.rect().height() - delta_h)
+        # Siblings share this container's parent, so compare in parent coordinates
+        # using model.y (kept equal to pos().y()) instead of a scenePos() per item
+        old_bottom = self.model.y + (self.rect().height() - delta_h)
+        threshold = old_bottom - 1.0 # Add a small tolerance
         
-        siblings = []
         parent_item = self.parentItem()
         if parent_item:
             siblings = parent_item.childItems()
         else:
-            siblings = scene.items()
+            # Top level: parent coordinates are scene coordinates, so let the scene's
+            # BSP index return only items reaching below the threshold
+            below_region = QRectF(-_FLOW_QUERY_EXTENT, threshold,
+                                  2 * _FLOW_QUERY_EXTENT, _FLOW_QUERY_EXTENT)
+            siblings = scene.items(below_region, Qt.IntersectsItemBoundingRect)
             
-        for item in siblings:
-            if item == self: 
-                continue
-            if not isinstance(item, BaseEditorItem):
-                continue
+        below = [
+            item for item in siblings
+            if isinstance(item, BaseEditorItem) and item is not self
             # Avoid moving parent or unrelated
-            if item.parentItem() != self.parentItem():
-                continue
-                
-            # Check if item is below
-            item_y = item.scenePos().y()
-            
+            and item.parentItem() is parent_item
             # If item top was at or below my old bottom (roughly)
-            # Add a small tolerance
-            if item_y >= (old_bottom - 1.0):
-                # Move it
-                item.moveBy(0, delta_h)
-                # Update model
-                item.model.y += delta_h
-
-
+            and item.model.y >= threshold
+        ]
+        for item in below:
+            # Move it and its model together
+            item.set_pos_silent(item.model.x, item.model.y + delta_h)
 
     def create_properties_widget(self, parent):
         from PySide6.QtWidgets import QWidget, QFormLayout, QLineEdit, QCheckBox, QComboBox, QPushButton, QDoubleSpinBox, QSpinBox, QLabel
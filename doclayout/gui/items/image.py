@@ -1,36 +1,51 @@
 from PySide6.QtWidgets import QGraphicsRectItem
 from PySide6.QtCore import Qt, QRectF
-from PySide6.QtGui import QPixmap, QPainter
+from PySide6.QtGui import QPixmap, QPainter, QPixmapCache
 from doclayout.core.models import BaseElement
 from .base import BaseEditorItem
+from ..handles import ResizeHandle
 
 class ImageEditorItem(BaseEditorItem, QGraphicsRectItem):
+    # Resize handle, created on first selection
+    handle_positions = (ResizeHandle.BOTTOM_RIGHT,)
+
+    # "Image" placeholder for items without a path, shared by all (see _placeholder)
+    _PLACEHOLDER = None
+
     def __init__(self, model: BaseElement):
         QGraphicsRectItem.__init__(self, 0, 0, model.width, model.height)
         BaseEditorItem.__init__(self, model)
         
         self.setPos(model.x, model.y)
         self._pixmap = QPixmap()
+        # Source pixmap pre-scaled to the on-screen rect; see _scaled_pixmap
+        self._scaled = None
+        self._scaled_key = ()
+        # True while a resize handle is dragged: paint unsmoothed, skip the scaled cache
+        self._interactive = False
         
         # Load Image if exists
         self.load_image(model.props.get("image_path", ""))
         
-        # Resize Handle
-        from ..handles import ResizeHandle
-        self._handle = ResizeHandle(ResizeHandle.BOTTOM_RIGHT, self)
-        self._handle.setVisible(False)
-        
+    @classmethod
+    def _placeholder(cls):
+        """Shared placeholder pixmap, drawn on first use (needs a QGuiApplication)."""
+        if ImageEditorItem._PLACEHOLDER is None:
+            pix = QPixmap(100, 100)
+            pix.fill(Qt.lightGray)
+            painter = QPainter(pix)
+            painter.drawText(pix.rect(), Qt.AlignCenter, "Image")
+            painter.end()
+            ImageEditorItem._PLACEHOLDER = pix
+        return ImageEditorItem._PLACEHOLDER
+
     def load_image(self, path):
         if not path:
-             # Placeholder
-             pix = QPixmap(100, 100)
-             pix.fill(Qt.lightGray)
-             painter = QPainter(pix)
-             painter.drawText(pix.rect(), Qt.AlignCenter, "Image")
-             painter.end()
-             self._pixmap = pix
+             self._pixmap = self._placeholder()
         else:
              self._pixmap = QPixmap(path)
+        self._source = path or "<placeholder>"
+        self._scaled, self._scaled_key = None, ()
              
         # Set default size if model is empty
         if self.model.width <= 0 or self.model.height <= 0:
@@ -52,10 +67,46 @@ class ImageEditorItem(BaseEditorItem, QGraphicsRectItem):
         self.update_handles()
         self.update()
 
+    def begin_resize(self):
+        """Called by ResizeHandle on press: draw with fast scaling until end_resize()."""
+        self._interactive = True
+
+    def end_resize(self):
+        """Called by ResizeHandle on release: repaint once from the smooth scaled copy."""
+        self._interactive = False
+        self.update()
+
+    def _scaled_pixmap(self, painter):
+        """
+        Return the source pixmap scaled to the rect's size in device pixels.
+        Rebuilt only when that size or the image changes; scaled copies are shared
+        between items showing the same file through QPixmapCache.
+        """
+        dev = painter.worldTransform().mapRect(self.rect())
+        dpr = painter.device().devicePixelRatioF()
+        w, h = round(dev.width() * dpr), round(dev.height() * dpr)
+        if w <= 0 or h <= 0:
+            return self._pixmap
+        
+        key = (w, h, self._pixmap.cacheKey())
+        if key != self._scaled_key:
+            cache_key = f"doclayout-image:{self._source}:{w}x{h}"
+            pix = QPixmapCache.find(cache_key)
+            if pix is None or pix.isNull():
+                pix = self._pixmap.scaled(w, h, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+                QPixmapCache.insert(cache_key, pix)
+            self._scaled, self._scaled_key = pix, key
+        return self._scaled
+
     def paint(self, painter, option, widget):
-        if not self._pixmap.isNull():
-            # Draw pixmap scaled to rect
+        if self._interactive and not self._pixmap.isNull():
+            # Mid-drag: nearest-neighbour scaling of the source, no cache churn per size
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, False)
             painter.drawPixmap(self.rect(), self._pixmap, QRectF(self._pixmap.rect()))
+        elif not self._pixmap.isNull():
+            # Pre-scaled to the device size, so this is a 1:1 blit
+            pix = self._scaled_pixmap(painter)
+            painter.drawPixmap(self.rect(), pix, QRectF(pix.rect()))
         
         self.paint_lock_icons(painter)
         
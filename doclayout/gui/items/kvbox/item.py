@@ -2,17 +2,40 @@
 KV Box editor item implementation.
 """
 
+import functools
 from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsTextItem, QGraphicsItem
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPen, QColor
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QPen, QColor, QFont
+
+from doclayout.core.geometry import PT_TO_MM
 
 from ..base import BaseEditorItem
+from ...handles import ResizeHandle
 from .properties import KVBoxPropertiesWidget
 
+@functools.lru_cache(maxsize=128)
+def _label_font(family: str, pixel_size, bold: bool, italic: bool) -> QFont:
+    """Label font for a style, shared by every KV box using it."""
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setFamily(family)
+    font.setBold(bold)
+    font.setItalic(italic)
+    return font
+
 class KVBoxEditorItem(BaseEditorItem, QGraphicsRectItem):
     """
     A graphics item that displays a label-value pair in a box.
     """
+    # Resize handle, created on first selection
+    handle_positions = (ResizeHandle.BOTTOM_RIGHT,)
+
+    # Quiet period (ms) before a scheduled relayout runs; see schedule_update_visuals
+    VISUALS_DELAY_MS = 50
+
+    # Guide mode outline (show_outline off), shared by all KV boxes
+    _GUIDE_PEN = QPen(QColor(200, 200, 200), 0.2, Qt.DashLine)
+
     def __init__(self, model) -> None:
         """Initialize with model data."""
         QGraphicsRectItem.__init__(self, 0, 0, model.width, model.height)
@@ -25,25 +48,26 @@ class KVBoxEditorItem(BaseEditorItem, QGraphicsRectItem):
         self.val_label.document().setDocumentMargin(0)
         
         self.update_visuals()
-        
-        from ...handles import ResizeHandle
-        self._handle = ResizeHandle(ResizeHandle.BOTTOM_RIGHT, self)
-        self._handle.setVisible(False)
 
     def update_visuals(self) -> None:
         """Sync visual state from model properties."""
-        from doclayout.core.geometry import PT_TO_MM
         props = self.model.props
+        # Everything below only depends on these: skip the label relayout if none changed
+        sig = (self.model.width, self.model.height,
+               props.get("key_text"), props.get("text"), props.get("color"),
+               props.get("font_family"), props.get("font_size"),
+               props.get("font_bold"), props.get("font_italic"),
+               props.get("split_type"), props.get("split_ratio"), props.get("split_fixed"))
+        if sig == getattr(self, '_visuals_sig', None):
+            return
+        self._visuals_sig = sig
         
         self.key_label.setPlainText(str(props.get("key_text", "Label:")))
         self.val_label.setPlainText(str(props.get("text", "[Value]")))
         
-        font = self.key_label.font()
         target_pt = props.get("font_size", 10)
-        font.setPixelSize(target_pt * PT_TO_MM)
-        font.setFamily(props.get("font_family", "Arial"))
-        font.setBold(props.get("font_bold", False))
-        font.setItalic(props.get("font_italic", False))
+        font = _label_font(props.get("font_family", "Arial"), target_pt * PT_TO_MM,
+                           props.get("font_bold", False), props.get("font_italic", False))
         
         self.key_label.setFont(font)
         self.val_label.setFont(font)
@@ -56,8 +80,15 @@ class KVBoxEditorItem(BaseEditorItem, QGraphicsRectItem):
         stype = props.get("split_type", "ratio")
         
         if stype == "auto":
-            self.key_label.setTextWidth(-1)
-            split = self.key_label.boundingRect().width() + 1.0
+            # Natural label width only depends on the text and font: measure it
+            # once per change instead of on every resize
+            auto_key = (props.get("key_text", "Label:"), font.family(), target_pt,
+                        font.bold(), font.italic())
+            if auto_key != getattr(self, '_auto_width_key', None):
+                self.key_label.setTextWidth(-1)
+                self._auto_width_key = auto_key
+                self._auto_width = self.key_label.boundingRect().width()
+            split = self._auto_width + 1.0
         elif stype == "fixed":
             split = props.get("split_fixed", 20.0)
         else:
@@ -69,8 +100,43 @@ class KVBoxEditorItem(BaseEditorItem, QGraphicsRectItem):
         
         self.key_label.setPos(0.5, (h - self.key_label.boundingRect().height()) / 2)
         self.val_label.setPos(split + 0.5, (h - self.val_label.boundingRect().height()) / 2)
+        # Labels just changed: recompute the divider on the next paint
+        self._divider_sig = None
         self.update()
 
+    def schedule_update_visuals(self) -> None:
+        """
+        Run update_visuals once the edits stop for VISUALS_DELAY_MS, so a burst
+        of property changes (typing) costs a single label relayout.
+        """
+        if getattr(self, '_visuals_timer', None) is None:
+            # Owned by the item, so a pending relayout survives its properties widget
+            self._visuals_timer = QTimer()
+            self._visuals_timer.setSingleShot(True)
+            self._visuals_timer.setInterval(self.VISUALS_DELAY_MS)
+            self._visuals_timer.timeout.connect(self.update_visuals)
+        self._visuals_timer.start()
+
+    def _divider_x(self) -> float:
+        """
+        X of the key/value divider line, cached until the split props or width change
+        (or update_visuals relays out the labels).
+        """
+        props, w = self.model.props, self.model.width
+        stype = props.get("split_type", "ratio")
+        sig = (stype, w, props.get("split_fixed", 20.0), props.get("split_ratio", 0.4))
+        if sig == getattr(self, '_divider_sig', None):
+            return self._divider
+        
+        if stype == "fixed":
+             split = sig[2]
+        elif stype == "auto":
+             split = self.key_label.boundingRect().width() + 2.0
+        else:
+             split = w * sig[3]
+        self._divider_sig, self._divider = sig, split
+        return split
+
     def setRect(self, x, y, w, h) -> None:
         """Handle resizing from handles."""
         super().setRect(0, 0, w, h)
@@ -78,30 +144,27 @@ class KVBoxEditorItem(BaseEditorItem, QGraphicsRectItem):
         self.update_visuals()
         self.update_handles()
 
+    def _outline_pens(self) -> tuple:
+        """(border, divider) pens for the current props, rebuilt only when they change."""
+        props = self.model.props
+        key = (props.get("border_color", "black"), props.get("divider_color", "black"),
+               props.get("stroke_width", 0.5))
+        if key != getattr(self, '_pens_key', None):
+            self._pens_key = key
+            self._pens = (QPen(QColor(key[0]), key[2]), QPen(QColor(key[1]), key[2]))
+        return self._pens
+
     def paint(self, painter, option, widget) -> None:
         """Custom paint logic for borders and dividers."""
-        props = self.model.props
-        show_outline = props.get("show_outline", True)
-        outline_w = props.get("stroke_width", 0.5)
-        
-        if show_outline:
-            painter.setPen(QPen(QColor(props.get("border_color", "black")), outline_w))
+        if not self.model.props.get("show_outline", True):
+            painter.setPen(self._GUIDE_PEN)
+            painter.drawRect(self.rect())
         else:
-            pen = QPen(QColor(200, 200, 200), 0.2, Qt.DashLine)
-            painter.setPen(pen)
-
-        painter.drawRect(self.rect())
-        
-        if show_outline:
-            w, stype = self.model.width, props.get("split_type", "ratio")
-            if stype == "fixed":
-                 split = props.get("split_fixed", 20.0)
-            elif stype == "auto":
-                 split = self.key_label.boundingRect().width() + 2.0
-            else:
-                 split = w * props.get("split_ratio", 0.4)
-            
-            painter.setPen(QPen(QColor(props.get("divider_color", "black")), outline_w))
+            border_pen, divider_pen = self._outline_pens()
+            painter.setPen(border_pen)
+            painter.drawRect(self.rect())
+            split = self._divider_x()
+            painter.setPen(divider_pen)
             painter.drawLine(split, 0, split, self.model.height)
         
         self.paint_lock_icons(painter)
@@ -129,17 +129,17 @@ class KVBoxPropertiesWidget(QWidget):
 
     def _on_key_changed(self, text: str) -> None:
         self.model.props["key_text"] = text
-        self.item.update_visuals()
+        self.item.schedule_update_visuals()
 
     def _on_val_changed(self, text: str) -> None:
         self.model.props["text"] = text
-        self.item.update_visuals()
+        self.item.schedule_update_visuals()
 
     def _on_split_type_changed(self, index: int) -> None:
         types = ["ratio", "fixed", "auto"]
         self.model.props["split_type"] = types[index]
         self._update_split_ui_visibility()
-        self.item.update_visuals()
+        self.item.schedule_update_visuals()
 
     def _update_split_ui_visibility(self) -> None:
         stype = self.model.props.get("split_type", "ratio")
@@ -148,11 +148,11 @@ class KVBoxPropertiesWidget(QWidget):
 
     def _on_split_ratio_changed(self, val: float) -> None:
         self.model.props["split_ratio"] = val
-        self.item.update_visuals()
+        self.item.schedule_update_visuals()
 
     def _on_split_fixed_changed(self, val: float) -> None:
         self.model.props["split_fixed"] = val
-        self.item.update_visuals()
+        self.item.schedule_update_visuals()
 
     def _on_outline_toggled(self, checked: bool) -> None:
         self.model.props["show_outline"] = checked
@@ -167,7 +167,7 @@ class KVBoxPropertiesWidget(QWidget):
         self.model.props["font_size"] = self._prop_font_size.value()
         self.model.props["font_bold"] = self._prop_bold.isChecked()
         self.model.props["font_italic"] = self._prop_italic.isChecked()
-        self.item.update_visuals()
+        self.item.schedule_update_visuals()
 
     def _update_btn_color(self, btn: QPushButton, hex_color: str) -> None:
         fg = "white" if hex_color in ("black", "#000000") else "black"
@@ -181,7 +181,7 @@ class KVBoxPropertiesWidget(QWidget):
             hex_color = color.name()
             self.model.props["color"] = hex_color
             self._update_btn_color(self._btn_color, hex_color)
-            self.item.update_visuals()
+            self.item.schedule_update_visuals()
 
     def _on_generic_color_clicked(self, prop_key: str, btn: QPushButton) -> None:
         from PySide6.QtWidgets import QColorDialog
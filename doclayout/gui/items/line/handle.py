@@ -13,6 +13,10 @@ class LineHandle(QGraphicsRectItem):
     SIZE = 2.0 # Match ResizeHandle
     START = 0
     END = 1
+
+    # Professional look: Semi-transparent White fill, Blue border (Google Blue)
+    _BRUSH = QBrush(QColor(255, 255, 255, 180))
+    _PEN = QPen(QColor("#1a73e8"), 0.3)
     
     def __init__(self, position_type: int, parent: QGraphicsItem) -> None:
         """
@@ -25,9 +29,8 @@ class LineHandle(QGraphicsRectItem):
         super().__init__(-self.SIZE/2, -self.SIZE/2, self.SIZE, self.SIZE, parent)
         self._type = position_type
         
-        # Professional look: Semi-transparent White fill, Blue border
-        self.setBrush(QBrush(QColor(255, 255, 255, 180)))
-        self.setPen(QPen(QColor("#1a73e8"), 0.3)) # Google Blue
+        self.setBrush(self._BRUSH)
+        self.setPen(self._PEN)
         
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
@@ -36,8 +39,8 @@ class LineHandle(QGraphicsRectItem):
     def paint(self, painter, option, widget):
         """Draw as a professional square with antialiasing."""
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setBrush(self.brush())
-        painter.setPen(self.pen())
+        painter.setBrush(self._BRUSH)
+        painter.setPen(self._PEN)
         painter.drawRect(self.rect())
 
     def mouseMoveEvent(self, event) -> None:
@@ -45,14 +48,22 @@ class LineHandle(QGraphicsRectItem):
         new_scene_pos = self.mapToScene(event.pos())
         
         # Grid Snap
-        if hasattr(self.scene(), 'alignment') and self.scene().alignment.snap_enabled:
-             grid = self.scene().alignment.grid_size
+        align = getattr(self.scene(), 'alignment', None)
+        if align is not None and align.snap_enabled:
+             grid, inv = align.grid_size, align.inv_grid
              new_scene_pos = QPointF(
-                 round(new_scene_pos.x() / grid) * grid,
-                 round(new_scene_pos.y() / grid) * grid
+                 (new_scene_pos.x() * inv + 0.5) // 1 * grid,
+                 (new_scene_pos.y() * inv + 0.5) // 1 * grid
              )
         
         parent = self.parentItem()
         new_pos = parent.mapFromScene(new_scene_pos)
         self.setPos(new_pos)
         parent.update_line_from_handles()
+
+    def mouseReleaseEvent(self, event) -> None:
+        """Report the final line geometry once the drag ends."""
+        super().mouseReleaseEvent(event)
+        parent = self.parentItem()
+        if parent and parent.scene() and hasattr(parent.scene(), "itemMoved"):
+            parent.scene().itemMoved.emit(parent)
@@ -3,14 +3,25 @@ Line editor item implementation.
 """
 
 import math
-from PySide6.QtWidgets import QGraphicsLineItem, QGraphicsItem
+from PySide6.QtWidgets import QGraphicsLineItem, QGraphicsItem, QStyleOptionGraphicsItem
 from PySide6.QtCore import Qt, QPointF
 from PySide6.QtGui import QPen, QColor, QPolygonF
 
+from doclayout.core.geometry import PT_TO_MM
+
 from ..base import BaseEditorItem
 from .handle import LineHandle
 from .properties import LinePropertiesWidget
 
+# Arrowhead half-angle (30 degrees) as a fixed rotation
+_COS30 = math.cos(math.pi / 6)
+_SIN30 = math.sin(math.pi / 6)
+
+# stroke_style / stroke_cap prop values -> Qt enums
+_STYLE_MAP = {"Solid": Qt.SolidLine, "Dash": Qt.DashLine, "Dot": Qt.DotLine,
+              "DashDot": Qt.DashDotLine, "DashDotDot": Qt.DashDotDotLine}
+_CAP_MAP = {"Square": Qt.SquareCap, "Flat": Qt.FlatCap, "Round": Qt.RoundCap}
+
 class LineEditorItem(BaseEditorItem, QGraphicsLineItem):
     """
     A graphics item representing a line with optional arrowheads.
@@ -36,34 +47,61 @@ class LineEditorItem(BaseEditorItem, QGraphicsLineItem):
 
     def paint(self, painter, option, widget) -> None:
         """Draw the line and arrowheads."""
-        super().paint(painter, option, widget)
+        # Not QGraphicsLineItem.paint: selection is shown by the endpoint handles,
+        # so its dashed selection box is not needed
+        painter.setPen(self.pen())
+        painter.drawLine(self.line())
         
-        start_arrow = self.model.props.get("start_arrow", "None")
-        end_arrow = self.model.props.get("end_arrow", "None")
-        
-        if start_arrow != "None" or end_arrow != "None":
-            line = self.line()
-            p1, p2 = line.p1(), line.p2()
-            angle = math.atan2(p2.y() - p1.y(), p2.x() - p1.x())
-            arrow_size = float(self.model.props.get("stroke_width", 2.0)) * 3.0
-            
+        # Arrowheads under a device pixel are invisible: skip building and drawing them
+        arrow_size = float(self.model.props.get("stroke_width", 2.0)) * 3.0
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        arrows = self._arrow_polygons() if lod * arrow_size >= 1.0 else ()
+        if arrows:
             painter.save()
             painter.setBrush(self.pen().color())
-            
-            if start_arrow == "Triangle":
-                self._draw_arrow(painter, p1, angle + math.pi, arrow_size)
-            if end_arrow == "Triangle":
-                self._draw_arrow(painter, p2, angle, arrow_size)
+            for polygon in arrows:
+                painter.drawPolygon(polygon)
             painter.restore()
 
         self.paint_lock_icons(painter)
 
-    def _draw_arrow(self, painter, point: QPointF, angle: float, size: float) -> None:
-        p1 = point + QPointF(math.cos(angle - math.pi + math.pi/6) * size,
-                             math.sin(angle - math.pi + math.pi/6) * size)
-        p2 = point + QPointF(math.cos(angle - math.pi - math.pi/6) * size,
-                             math.sin(angle - math.pi - math.pi/6) * size)
-        painter.drawPolygon(QPolygonF([point, p1, p2]))
+    def _arrow_polygons(self) -> tuple:
+        """
+        Arrowhead polygons for the current line and arrow props.
+        Rebuilt only when the endpoints, stroke width or arrow types change.
+        """
+        props = self.model.props
+        start_arrow = props.get("start_arrow", "None")
+        end_arrow = props.get("end_arrow", "None")
+        if start_arrow == "None" and end_arrow == "None":
+            return ()
+
+        line = self.line()
+        key = (line.x1(), line.y1(), line.x2(), line.y2(),
+               props.get("stroke_width", 2.0), start_arrow, end_arrow)
+        if key == getattr(self, '_arrow_key', None):
+            return self._arrows
+
+        # Unit direction of the line (+x for a zero-length line, as atan2 gives)
+        length = math.hypot(line.dx(), line.dy())
+        ux, uy = (line.dx() / length, line.dy() / length) if length else (1.0, 0.0)
+        arrow_size = float(key[4]) * 3.0
+        
+        arrows = []
+        if start_arrow == "Triangle":
+            arrows.append(self._arrow_polygon(line.p1(), -ux, -uy, arrow_size))
+        if end_arrow == "Triangle":
+            arrows.append(self._arrow_polygon(line.p2(), ux, uy, arrow_size))
+        self._arrow_key, self._arrows = key, tuple(arrows)
+        return self._arrows
+
+    def _arrow_polygon(self, point: QPointF, ux: float, uy: float, size: float) -> QPolygonF:
+        """Triangle at point, pointing along (ux, uy): the two back corners are the
+        reversed direction rotated by +/-30 degrees."""
+        dx, dy = ux * size, uy * size
+        p1 = point - QPointF(dx * _COS30 - dy * _SIN30, dy * _COS30 + dx * _SIN30)
+        p2 = point - QPointF(dx * _COS30 + dy * _SIN30, dy * _COS30 - dx * _SIN30)
+        return QPolygonF([point, p1, p2])
 
     def update_handles(self, selected: bool = None) -> None:
         """Toggle handle visibility."""
@@ -75,14 +113,16 @@ class LineEditorItem(BaseEditorItem, QGraphicsLineItem):
 
     def update_pen(self) -> None:
         """Sync pen styling from model."""
-        from doclayout.core.geometry import PT_TO_MM
         props = self.model.props
-        width_mm = float(props.get("stroke_width", 2.0)) * PT_TO_MM
-        color = QColor(props.get("stroke_color", "#000000"))
-        style = getattr(Qt, f"{props.get('stroke_style', 'Solid')}Line", Qt.SolidLine)
-        cap = getattr(Qt, f"{props.get('stroke_cap', 'Square')}Cap", Qt.SquareCap)
-        
-        self.setPen(QPen(color, width_mm, style, cap))
+        key = (props.get("stroke_width", 2.0), props.get("stroke_color", "#000000"),
+               props.get("stroke_style", "Solid"), props.get("stroke_cap", "Square"))
+        # setPen() re-runs prepareGeometryChange; only call it when the pen differs
+        if key != getattr(self, '_pen_key', None):
+            self._pen_key = key
+            width_mm = float(key[0]) * PT_TO_MM
+            style = _STYLE_MAP.get(key[2], Qt.SolidLine)
+            cap = _CAP_MAP.get(key[3], Qt.SquareCap)
+            self.setPen(QPen(QColor(key[1]), width_mm, style, cap))
         self.update()
 
     def update_line_from_handles(self) -> None:
@@ -96,8 +136,14 @@ class LineEditorItem(BaseEditorItem, QGraphicsLineItem):
         self.model.width = abs(scene_p2.x() - scene_p1.x())
         self.model.height = abs(scene_p2.y() - scene_p1.y())
 
-        if self.scene() and hasattr(self.scene(), "itemMoved"):
-             self.scene().itemMoved.emit(self)
+        if self.scene() and hasattr(self.scene(), "itemMovedLive"):
+             self.scene().itemMovedLive.emit(self)
+
+    def set_pos_silent(self, x: float, y: float) -> None:
+        """Silent move (see BaseEditorItem); also carries the end point along."""
+        super().set_pos_silent(x, y)
+        line = self.line()
+        self.model.props.update({"x2": x + line.dx(), "y2": y + line.dy()})
 
     def itemChange(self, change, value) -> any:
         """Handle selection and position changes."""
@@ -1,64 +1,105 @@
-from PySide6.QtWidgets import QGraphicsRectItem
+import functools
+import os
+from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsItem
 from PySide6.QtCore import Qt, QRectF
 from PySide6.QtGui import QPen, QBrush, QColor, QPixmap, QPainter
 from doclayout.core.models import BaseElement
+from doclayout.core.geometry import PT_TO_MM
 from .base import BaseEditorItem
+from ..handles import ResizeHandle
+
+@functools.lru_cache(maxsize=16)
+def _load_bg_pixmap(path: str, mtime) -> QPixmap:
+    """
+    Decode a background image once per file version (mtime is part of the key),
+    shared by every rect using it.
+    """
+    return QPixmap(path)
 
 class RectEditorItem(BaseEditorItem, QGraphicsRectItem):
+    # Resize handles, created on first selection
+    handle_positions = ResizeHandle.ALL_POSITIONS
+
+    # Guide mode outline (show_outline off), shared by all rects
+    _GUIDE_PEN = QPen(QColor(200, 200, 200))
+    _GUIDE_PEN.setStyle(Qt.DashLine)
+    _GUIDE_PEN.setWidthF(0.2)
+
     def __init__(self, model: BaseElement):
         QGraphicsRectItem.__init__(self, 0, 0, model.width, model.height)
         BaseEditorItem.__init__(self, model)
         self.setPos(model.x, model.y)
+        # Keep the rasterized item between repaints; update() (issued by every
+        # props/geometry change) invalidates it
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
         self._bg_pixmap = None
         self._update_pixmap()
-        
-        from ..handles import ResizeHandle
-        self._handles = [
-            ResizeHandle(ResizeHandle.TOP_LEFT, self),
-            ResizeHandle(ResizeHandle.TOP_RIGHT, self),
-            ResizeHandle(ResizeHandle.BOTTOM_RIGHT, self),
-            ResizeHandle(ResizeHandle.BOTTOM_LEFT, self),
-            ResizeHandle(ResizeHandle.TOP, self),
-            ResizeHandle(ResizeHandle.BOTTOM, self),
-            ResizeHandle(ResizeHandle.LEFT, self),
-            ResizeHandle(ResizeHandle.RIGHT, self),
-        ]
-        for h in self._handles:
-            h.setVisible(False)
 
-    def paint(self, painter, option, widget):
+    def _outline_pen(self) -> QPen:
+        """Pen for the current outline props, rebuilt only when they change."""
+        props = self.model.props
+        if not props.get("show_outline", False):
+            # Guide mode for editor
+            return self._GUIDE_PEN
+
+        key = (props.get("stroke_width", 1.0), props.get("stroke_color", "#000000"))
+        if key == getattr(self, '_pen_key', None):
+            return self._pen
+
+        pen = QPen()
+        pen.setColor(QColor(key[1]))
+        pen.setWidthF(float(key[0]) * PT_TO_MM)
+        pen.setCosmetic(False)
+        self._pen_key, self._pen = key, pen
+        return pen
+
+    def _fill_brush(self):
+        """Brush for a solid fill, rebuilt only when fill color or opacity change."""
         props = self.model.props
-        bg_type = props.get("bg_type", "transparent")
+        key = (props.get("fill_color", "#ffffff"), props.get("opacity", 255))
+        if key == getattr(self, '_brush_key', None):
+            return self._brush
+
+        color = QColor(key[0])
+        color.setAlpha(key[1])
+        self._brush_key, self._brush = key, QBrush(color)
+        return self._brush
+
+    def _scaled_bg(self, painter) -> QPixmap:
+        """
+        Background pixmap scaled to the rect's size in device pixels,
+        rebuilt only when that size or the pixmap changes.
+        None if the rect covers less than a device pixel.
+        """
+        dev = painter.worldTransform().mapRect(self.rect())
+        dpr = painter.device().devicePixelRatioF()
+        w, h = round(dev.width() * dpr), round(dev.height() * dpr)
+        if w <= 0 or h <= 0:
+            return None
+
+        key = (w, h, self._bg_pixmap.cacheKey())
+        if key != getattr(self, '_scaled_key', None):
+            self._scaled_key = key
+            self._scaled_bg_pixmap = self._bg_pixmap.scaled(w, h, Qt.IgnoreAspectRatio,
+                                                            Qt.SmoothTransformation)
+        return self._scaled_bg_pixmap
+
+    def paint(self, painter, option, widget):
+        bg_type = self.model.props.get("bg_type", "transparent")
         
         if bg_type == "image" and self._bg_pixmap:
-            painter.drawPixmap(self.rect(), self._bg_pixmap, QRectF(self._bg_pixmap.rect()))
+            # Pre-scaled to the device size, so this is a 1:1 blit
+            pix = self._scaled_bg(painter)
+            if pix is not None:
+                painter.drawPixmap(self.rect(), pix, QRectF(pix.rect()))
         elif bg_type == "solid":
-            color = QColor(props.get("fill_color", "#ffffff"))
-            color.setAlpha(props.get("opacity", 255))
-            painter.setBrush(QBrush(color))
+            painter.setBrush(self._fill_brush())
         else:
             painter.setBrush(Qt.NoBrush)
             
         # Stroke
-        show_outline = props.get("show_outline", False)
-        if show_outline:
-            from doclayout.core.geometry import PT_TO_MM
-            width_pt = float(props.get("stroke_width", 1.0))
-            width_mm = width_pt * PT_TO_MM
-            
-            pen = QPen()
-            stroke_color = props.get("stroke_color", "#000000")
-            pen.setColor(QColor(stroke_color))
-            pen.setWidthF(width_mm)
-            pen.setCosmetic(False)
-            painter.setPen(pen)
-        else:
-            # Guide mode for editor
-            guide_pen = QPen(QColor(200, 200, 200))
-            guide_pen.setStyle(Qt.DashLine)
-            guide_pen.setWidthF(0.2)
-            painter.setPen(guide_pen)
+        painter.setPen(self._outline_pen())
             
         super().paint(painter, option, widget)
         self.paint_lock_icons(painter)
@@ -68,8 +109,11 @@ class RectEditorItem(BaseEditorItem, QGraphicsRectItem):
         bg_type = self.model.props.get("bg_type", "transparent")
         img_path = self.model.props.get("bg_image")
         if bg_type == "image" and img_path:
-            from PySide6.QtGui import QPixmap
-            self._bg_pixmap = QPixmap(img_path)
+            try:
+                mtime = os.path.getmtime(img_path)
+            except OSError:
+                mtime = None
+            self._bg_pixmap = _load_bg_pixmap(img_path, mtime)
         else:
             self._bg_pixmap = None
         self.update()
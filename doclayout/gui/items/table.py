@@ -1,7 +1,10 @@
-from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsItem
-from PySide6.QtCore import Qt, QRectF
-from PySide6.QtGui import QPen, QColor, QBrush, QFont
+import csv
+import io
+from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsItem, QStyleOptionGraphicsItem
+from PySide6.QtCore import Qt, QRectF, QLineF, QPointF, QTimer
+from PySide6.QtGui import QPen, QColor, QBrush, QFont, QStaticText, QTransform
 from .base import BaseEditorItem
+from ..handles import ResizeHandle
 from doclayout.core.models import BaseElement
 
 class TableEditorItem(BaseEditorItem, QGraphicsRectItem):
@@ -9,10 +12,29 @@ class TableEditorItem(BaseEditorItem, QGraphicsRectItem):
     A Table item that displays grid data.
     Works like a spreadsheet within the editor.
     """
+    # Resize handles, created on first selection
+    handle_positions = ResizeHandle.ALL_POSITIONS
+
+    # setRect also rewrites props["row_height"], which a geometry delta does not record
+    supports_geometry_delta = False
+
+    # Quiet period (ms) after the last edit before the CSV text is parsed
+    DATA_PARSE_DELAY_MS = 150
+
+    # Paint styles, shared by all tables
+    _BORDER_PEN = QPen(QColor(0, 0, 0))
+    _BORDER_PEN.setWidthF(0.2)
+    _GRID_PEN = QPen(QColor(200, 200, 200), 0.1)
+    _BG_BRUSH = QBrush(QColor(255, 255, 255))
+    _HEADER_COLOR = QColor(240, 240, 240)
+
     def __init__(self, model: BaseElement):
         QGraphicsRectItem.__init__(self, 0, 0, model.width, model.height)
         BaseEditorItem.__init__(self, model)
         self.setPos(model.x, model.y)
+        # Keep the rasterized item between repaints; update() (issued by every
+        # props/geometry change) invalidates it
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
         # Default properties
         if "data" not in self.model.props:
@@ -32,75 +54,116 @@ class TableEditorItem(BaseEditorItem, QGraphicsRectItem):
         if "num_rows_editor" not in self.model.props:
             data = self.model.props.get("data", [])
             self.model.props["num_rows_editor"] = len(data) if data else 3
-            
-        from ..handles import ResizeHandle
-        self._handles = [
-            ResizeHandle(ResizeHandle.TOP_LEFT, self),
-            ResizeHandle(ResizeHandle.TOP_RIGHT, self),
-            ResizeHandle(ResizeHandle.BOTTOM_RIGHT, self),
-            ResizeHandle(ResizeHandle.BOTTOM_LEFT, self),
-            ResizeHandle(ResizeHandle.TOP, self),
-            ResizeHandle(ResizeHandle.BOTTOM, self),
-            ResizeHandle(ResizeHandle.LEFT, self),
-            ResizeHandle(ResizeHandle.RIGHT, self),
-        ]
-        for h in self._handles:
-            h.setVisible(False)
 
     def paint(self, painter, option, widget):
         painter.save()
         
         # Draw background and border
-        pen = QPen(QColor(0, 0, 0))
-        pen.setWidthF(0.2)
-        painter.setPen(pen)
-        painter.setBrush(QBrush(QColor(255, 255, 255)))
+        painter.setPen(self._BORDER_PEN)
+        painter.setBrush(self._BG_BRUSH)
         painter.drawRect(self.rect())
         
+        # Zoomed out so far that cells are under 2 device pixels: grid and text
+        # would be unreadable, so draw the cell area as one flat block instead
         data = self.model.props.get("data", [])
-        if not data:
-             painter.restore()
-             return
+        rows = len(data) if data else 0
+        cols = len(data[0]) if rows > 0 else 0
+        if rows > 0 and cols > 0:
+            lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+            cell = min(self.rect().width() / cols, self.rect().height() / rows)
+            if lod * cell < 2.0:
+                painter.fillRect(self.rect(), self._HEADER_COLOR)
+                painter.restore()
+                self.paint_lock_icons(painter)
+                return
+
+        layout = self._table_layout()
+        if layout is not None:
+            font, header_rect, grid_lines, cells = layout
+            painter.setFont(font)
+            
+            # Header background
+            if self.model.props.get("show_header", True):
+                painter.fillRect(header_rect, self._HEADER_COLOR)
+            
+            # Whole grid in one call
+            painter.setPen(self._GRID_PEN)
+            painter.drawLines(grid_lines)
+            
+            # Text
+            painter.setPen(self._BORDER_PEN)
+            for pos, static_text, clip_rect in cells:
+                if clip_rect is None:
+                    painter.drawStaticText(pos, static_text)
+                else:
+                    # Wider than its cell: clip like drawText(rect, ...) did
+                    painter.save()
+                    painter.setClipRect(clip_rect, Qt.IntersectClip)
+                    painter.drawStaticText(pos, static_text)
+                    painter.restore()
 
-        rows = len(data)
+        painter.restore()
+        self.paint_lock_icons(painter)
+
+    def _table_layout(self):
+        """
+        (font, header rect, grid lines, [(pos, QStaticText, clip rect or None)])
+        for the current data,
+        size and font size, or None for an empty table.
+        Rebuilt only when one of those changes; data is compared by identity,
+        since edits and bindings replace the list.
+        """
+        data = self.model.props.get("data", [])
+        rect = self.rect()
+        key = (rect.width(), rect.height(), self.model.props.get("font_size", 10))
+        if data is getattr(self, '_layout_data', None) and key == self._layout_key:
+            return self._layout
+
+        layout = None
+        rows = len(data) if data else 0
         cols = len(data[0]) if rows > 0 else 0
-        
         if rows > 0 and cols > 0:
-            row_h = self.rect().height() / rows
-            col_w = self.rect().width() / cols
+            w, h = key[0], key[1]
+            row_h = h / rows
+            col_w = w / cols
             
-            font_size_pt = float(self.model.props.get("font_size", 10))
+            font_size_pt = float(key[2])
             mm_size = font_size_pt * (25.4 / 72.0)
             
             font = QFont("Arial")
             font.setPixelSize(mm_size)
-            painter.setFont(font)
             
+            # cols + 1 vertical and rows + 1 horizontal lines
+            grid_lines = ([QLineF(c * col_w, 0, c * col_w, h) for c in range(cols + 1)] +
+                          [QLineF(0, r * row_h, w, r * row_h) for r in range(rows + 1)])
+            
+            # Alignment and padding: left aligned, vertically centred in the padded cell.
+            # Text is shaped once here as QStaticText; paint only blits the glyphs
+            padding = 1.0
+            identity = QTransform()
+            cells = []
             for r in range(rows):
-                # Header background
-                if r == 0 and self.model.props.get("show_header", True):
-                    painter.fillRect(QRectF(0, 0, self.rect().width(), row_h), QColor(240, 240, 240))
-                
                 for c in range(cols):
-                    cell_rect = QRectF(c * col_w, r * row_h, col_w, row_h)
-                    painter.setPen(QPen(QColor(200, 200, 200), 0.1))
-                    painter.drawRect(cell_rect)
-                    
-                    # Text
-                    pen.setColor(QColor(0, 0, 0))
-                    painter.setPen(pen)
                     try:
                         text = str(data[r][c])
                     except (IndexError, KeyError, TypeError):
                         text = ""
-                        
-                    # Alignment and padding
-                    padding = 1.0
-                    painter.drawText(cell_rect.adjusted(padding, padding, -padding, -padding), 
-                                     Qt.AlignLeft | Qt.AlignVCenter, text)
-                                     
-        painter.restore()
-        self.paint_lock_icons(painter)
+                    if not text:
+                        continue
+                    static_text = QStaticText(text)
+                    static_text.setTextFormat(Qt.PlainText)
+                    static_text.prepare(identity, font)
+                    size = static_text.size()
+                    text_rect = QRectF(c * col_w + padding, r * row_h + padding,
+                                       col_w - 2 * padding, row_h - 2 * padding)
+                    pos = QPointF(text_rect.x(), text_rect.y() + (text_rect.height() - size.height()) / 2)
+                    clip = text_rect if (size.width() > text_rect.width() or
+                                         size.height() > text_rect.height()) else None
+                    cells.append((pos, static_text, clip))
+            layout = (font, QRectF(0, 0, w, row_h), grid_lines, cells)
+
+        self._layout_data, self._layout_key, self._layout = data, key, layout
+        return layout
 
     def create_properties_widget(self, parent):
         from PySide6.QtWidgets import QWidget, QFormLayout, QTextEdit, QLabel
@@ -118,22 +181,55 @@ class TableEditorItem(BaseEditorItem, QGraphicsRectItem):
         data_edit.setMinimumHeight(100)
         
         def on_data_changed():
-            lines = data_edit.toPlainText().strip().split("\n")
-            if not lines or (len(lines) == 1 and not lines[0]):
-                new_data = []
-            else:
-                new_data = [l.split(",") for l in lines]
-            
-            self.model.props["data"] = new_data
-            
-            # Recalculate height based on new row count if auto-height desired
-            # For now, keep current rect but trigger repaint
-            self.update()
+            self._pending_csv = data_edit.toPlainText()
+            self._schedule_data_parse()
             
         data_edit.textChanged.connect(on_data_changed)
+        # Don't leave the last keystrokes waiting on the timer once the panel goes away
+        widget.destroyed.connect(self.flush_pending_edits)
         layout.addRow(data_edit)
         
         return widget
+
+    def _schedule_data_parse(self):
+        """Parse the edited CSV once typing pauses for DATA_PARSE_DELAY_MS."""
+        if getattr(self, '_parse_timer', None) is None:
+            # Owned by the item, so a pending edit survives its properties widget
+            self._parse_timer = QTimer()
+            self._parse_timer.setSingleShot(True)
+            self._parse_timer.setInterval(self.DATA_PARSE_DELAY_MS)
+            self._parse_timer.timeout.connect(self._apply_pending_csv)
+        self._parse_timer.start()
+
+    def flush_pending_edits(self):
+        """Apply a CSV edit still waiting on the parse timer."""
+        if getattr(self, '_parse_timer', None) is not None:
+            self._parse_timer.stop()
+        if getattr(self, '_pending_csv', None) is not None:
+            self._apply_pending_csv()
+
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.ItemSceneHasChanged and value is None:
+            # Removed (e.g. replaced by an undo restore): the model is no longer live
+            if getattr(self, '_parse_timer', None) is not None:
+                self._parse_timer.stop()
+            self._pending_csv = None
+        return super().itemChange(change, value)
+
+    def _apply_pending_csv(self):
+        """Store the edited CSV text as the table data."""
+        if self._pending_csv is None:
+            return
+        # A blank line still counts as a row with one empty cell
+        text = self._pending_csv.strip()
+        self._pending_csv = None
+        new_data = [row or [""] for row in csv.reader(io.StringIO(text))] if text else []
+        
+        self.model.props["data"] = new_data
+        
+        # Recalculate height based on new row count if auto-height desired
+        # For now, keep current rect but trigger repaint
+        self.update()
   
     def get_bindable_properties(self):
         return ["data", "font_size", "theme", "header_bg_color", "stroke_color"]
@@ -7,12 +7,16 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QTextOption, QPainterPath
 
 from ..base import BaseEditorItem
+from ...handles import ResizeHandle
 from .properties import TextPropertiesWidget
 
 class TextEditorItem(BaseEditorItem, QGraphicsTextItem):
     """
     A graphics item that renders text with styling and alignment.
     """
+    # Resize handle, created on first selection
+    handle_positions = (ResizeHandle.BOTTOM_RIGHT,)
+
     def __init__(self, model) -> None:
         """Initialize with model data."""
         QGraphicsTextItem.__init__(self)
@@ -26,13 +30,8 @@ class TextEditorItem(BaseEditorItem, QGraphicsTextItem):
         self.update_visual_font()
         self.update_alignment(model.props.get("text_align", "left"))
         
-        from ...handles import ResizeHandle
-        self._handle = ResizeHandle(ResizeHandle.BOTTOM_RIGHT, self)
-        self._handle.setVisible(False)
-        
     def update_visual_font(self) -> None:
         """Sync font styling from model."""
-        from doclayout.core.geometry import PT_TO_MM
         font = self.font()
         target_pt = self.model.props.get("font_size", 12)
         mm_size = target_pt * (25.4 / 72.0)
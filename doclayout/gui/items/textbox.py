@@ -4,9 +4,10 @@ Text box editor item implementation - dynamic height text container.
 
 from PySide6.QtWidgets import QGraphicsTextItem, QGraphicsItem
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QTextOption, QPainterPath
+from PySide6.QtGui import QTextOption, QPainterPath, QPen, QBrush, QColor
 
 from .base import BaseEditorItem
+from ..handles import ResizeHandle
 from .text.properties import TextPropertiesWidget
 
 class TextBoxEditorItem(BaseEditorItem, QGraphicsTextItem):
@@ -14,6 +15,12 @@ class TextBoxEditorItem(BaseEditorItem, QGraphicsTextItem):
     A text box that grows dynamically based on content.
     Similar to TextEditorItem but with dynamic height growth.
     """
+    # Resize handles, created on first selection
+    handle_positions = ResizeHandle.ALL_POSITIONS
+
+    # setRect also rewrites props["base_height"], which a geometry delta does not record
+    supports_geometry_delta = False
+
     def __init__(self, model) -> None:
         """Initialize with model data."""
         QGraphicsTextItem.__init__(self)
@@ -41,20 +48,6 @@ class TextBoxEditorItem(BaseEditorItem, QGraphicsTextItem):
         # Set text width to enable wrapping
         self.setTextWidth(model.width)
         
-        from ..handles import ResizeHandle
-        self._handles = [
-            ResizeHandle(ResizeHandle.TOP_LEFT, self),
-            ResizeHandle(ResizeHandle.TOP_RIGHT, self),
-            ResizeHandle(ResizeHandle.BOTTOM_RIGHT, self),
-            ResizeHandle(ResizeHandle.BOTTOM_LEFT, self),
-            ResizeHandle(ResizeHandle.TOP, self),
-            ResizeHandle(ResizeHandle.BOTTOM, self),
-            ResizeHandle(ResizeHandle.LEFT, self),
-            ResizeHandle(ResizeHandle.RIGHT, self),
-        ]
-        for h in self._handles:
-            h.setVisible(False)
-        
         # Monitor content changes to update model height
         self.document().contentsChange.connect(self.on_contents_change)
         
@@ -93,7 +86,6 @@ class TextBoxEditorItem(BaseEditorItem, QGraphicsTextItem):
              
     def update_visual_font(self) -> None:
         """Sync font styling from model."""
-        from doclayout.core.geometry import PT_TO_MM
         font = self.font()
         target_pt = self.model.props.get("font_size", 12)
         mm_size = target_pt * (25.4 / 72.0)
@@ -140,7 +132,6 @@ class TextBoxEditorItem(BaseEditorItem, QGraphicsTextItem):
             
             # Setup Pen (Border)
             if show_outline:
-                from PySide6.QtGui import QPen, QColor
                 stroke_color = props.get("stroke_color", "black")
                 stroke_width = float(props.get("stroke_width", 1.0))
                 pen = QPen(QColor(stroke_color))
@@ -151,7 +142,6 @@ class TextBoxEditorItem(BaseEditorItem, QGraphicsTextItem):
                 
             # Setup Brush (Background)
             if bg_color:
-                from PySide6.QtGui import QBrush, QColor
                 painter.setBrush(QBrush(QColor(bg_color)))
             else:
                 painter.setBrush(Qt.NoBrush)
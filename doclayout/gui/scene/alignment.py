@@ -16,6 +16,17 @@ class AlignmentManager:
         self.grid_size: int = 10
         self.guide_lines: List[QLineF] = []
 
+    @property
+    def grid_size(self) -> int:
+        """Grid spacing in mm."""
+        return self._grid_size
+
+    @grid_size.setter
+    def grid_size(self, size: int) -> None:
+        self._grid_size = size
+        # Reciprocal kept in sync so snapping multiplies instead of dividing
+        self.inv_grid: float = 1.0 / size if size else 0.0
+
     def check_alignment(self, moving_item, all_items: Optional[List] = None) -> None:
         """
         Check for alignments with other items and create guides.
@@ -89,4 +100,4 @@ class AlignmentManager:
         """
         if not self.snap_enabled:
             return value
-        return round(value / self.grid_size) * self.grid_size
+        return (value * self.inv_grid + 0.5) // 1 * self._grid_size
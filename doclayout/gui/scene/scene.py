@@ -4,7 +4,8 @@ Core Editor Scene implementation.
 
 import logging
 import json
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 from PySide6.QtWidgets import QGraphicsScene, QGraphicsItem
 from PySide6.QtCore import Qt, Signal, QRectF
 from PySide6.QtGui import QPainter, QColor, QPen
@@ -16,6 +17,19 @@ from .handlers import SceneEventHandler
 
 logger = logging.getLogger(__name__)
 
+Geometry = Tuple[float, float, float, float]
+
+@dataclass(slots=True)
+class GeometryDelta:
+    """
+    Undo entry for a geometry-only change of one element: (x, y, width, height)
+    before and after. Stored instead of a full snapshot for interactive resizes.
+    """
+    op: str
+    element_id: str
+    before: Geometry
+    after: Geometry
+
 class EditorScene(QGraphicsScene):
     """
     The main coordinator for element editing, hierarchy, and tools.
@@ -23,7 +37,8 @@ class EditorScene(QGraphicsScene):
     Signals:
         toolChanged: Emitted when the active tool changes.
         itemAdded: Emitted when an item is added to the scene.
-        itemMoved: Emitted when an item's geometry changes.
+        itemMoved: Emitted when an item's geometry changes (once per drag, on release).
+        itemMovedLive: Emitted on every step of an interactive move/resize drag.
         itemRemoved: Emitted when an item is deleted.
         hierarchyChanged: Emitted when parenting or grouping changes.
         sceneRestored: Emitted after a target undo/redo snapshot is restored.
@@ -31,6 +46,7 @@ class EditorScene(QGraphicsScene):
     toolChanged = Signal(str)
     itemAdded = Signal(QGraphicsItem)
     itemMoved = Signal(QGraphicsItem)
+    itemMovedLive = Signal(QGraphicsItem)
     itemRemoved = Signal(QGraphicsItem)
     hierarchyChanged = Signal()
     sceneRestored = Signal()
@@ -42,10 +58,15 @@ class EditorScene(QGraphicsScene):
         self._page_width: float = 210.0 # A4 Default
         self._page_height: float = 297.0
         
-        # Undo/Redo Stack (serialized json snapshots)
+        # Undo/Redo Stack (serialized json snapshots, or GeometryDelta entries
+        # applied on top of the nearest snapshot below them)
         self._undo_stack = []
         self._redo_stack = []
         self._max_undo = 50
+        self._pending_delta: Optional[GeometryDelta] = None
+        # Serialized state the top of the undo stack stands for (see _top_state);
+        # None until next needed after undo/redo
+        self._top_state_cache: Optional[str] = None
         
         # Template to store project settings
         self.template = Template(
@@ -57,7 +78,7 @@ class EditorScene(QGraphicsScene):
         self.alignment = AlignmentManager()
         self.clipboard = SceneClipboard()
         
-        self.itemMoved.connect(self.alignment.check_alignment)
+        self.itemMovedLive.connect(self.alignment.check_alignment)
         self._update_scene_rect()
         
         # Initial snapshot
@@ -68,17 +89,98 @@ class EditorScene(QGraphicsScene):
         try:
             snapshot = self.to_template().model_dump_json()
             # Avoid duplicate snapshots
-            if self._undo_stack and self._undo_stack[-1] == snapshot:
+            if self._undo_stack and self._top_state() == snapshot:
                 return
                 
-            self._undo_stack.append(snapshot)
-            if len(self._undo_stack) > self._max_undo:
-                self._undo_stack.pop(0)
-            self._redo_stack.clear()
+            self._push_undo(snapshot)
+            self._top_state_cache = snapshot
             logger.debug(f"Snapshot saved. Stack size: {len(self._undo_stack)}")
         except Exception as e:
             logger.error(f"Failed to save snapshot: {e}")
 
+    def begin_delta(self, op: str, item: QGraphicsItem) -> None:
+        """
+        Start recording a geometry-only change of `item` (e.g. a resize drag).
+        Finish with commit_delta(); this avoids serializing the whole template.
+        """
+        self._pending_delta = GeometryDelta(op, item.model.id, self._item_geometry(item), (0, 0, 0, 0))
+
+    def commit_delta(self, item: QGraphicsItem) -> None:
+        """Push the change started by begin_delta() onto the undo stack."""
+        delta = self._pending_delta
+        self._pending_delta = None
+        if delta is None or delta.element_id != item.model.id:
+            return
+        delta.after = self._item_geometry(item)
+        # Fold once here, so later duplicate checks are a plain string compare
+        state = self._top_state()
+        self._push_undo(delta)
+        self._top_state_cache = self._fold_delta(state, delta)
+        logger.debug(f"Delta saved ({delta.op}). Stack size: {len(self._undo_stack)}")
+
+    def discard_delta(self) -> None:
+        """Drop a change started by begin_delta() without recording it."""
+        self._pending_delta = None
+
+    def _push_undo(self, entry) -> None:
+        self._undo_stack.append(entry)
+        if len(self._undo_stack) > self._max_undo:
+            base = self._undo_stack.pop(0)
+            # Keep a full snapshot at the bottom for deltas to build on
+            if isinstance(self._undo_stack[0], GeometryDelta):
+                self._undo_stack[0] = self._fold_delta(base, self._undo_stack[0])
+        self._redo_stack.clear()
+
+    def _top_state(self) -> str:
+        """
+        The state the top of the undo stack stands for, as a snapshot:
+        the nearest snapshot with any deltas above it folded in.
+        Cached; only recomputed after undo/redo landed on a delta.
+        """
+        if self._top_state_cache is not None:
+            return self._top_state_cache
+        base = len(self._undo_stack) - 1
+        while isinstance(self._undo_stack[base], GeometryDelta):
+            base -= 1
+        state = self._undo_stack[base]
+        for delta in self._undo_stack[base + 1:]:
+            state = self._fold_delta(state, delta)
+        self._top_state_cache = state
+        return state
+
+    @staticmethod
+    def _item_geometry(item: QGraphicsItem) -> Geometry:
+        model = item.model
+        return (model.x, model.y, model.width, model.height)
+
+    @staticmethod
+    def _fold_delta(snapshot: str, delta: GeometryDelta) -> str:
+        """Return `snapshot` with `delta` applied, as a new snapshot."""
+        template = Template.model_validate_json(snapshot)
+        stack = list(template.items)
+        while stack:
+            element = stack.pop()
+            if element.id == delta.element_id:
+                element.x, element.y, element.width, element.height = delta.after
+                break
+            stack.extend(getattr(element, 'children', ()))
+        return template.model_dump_json()
+
+    def _apply_delta(self, delta: GeometryDelta, geometry: Geometry) -> None:
+        """Set the live item for `delta` to `geometry`."""
+        for item in self.items():
+            model = getattr(item, 'model', None)
+            if model is not None and model.id == delta.element_id:
+                x, y, w, h = geometry
+                # Exact restore: no snapping, lock check or move signals
+                item.set_pos_silent(x, y)
+                if hasattr(item, 'setRect'):
+                    item.setRect(0, 0, w, h)
+                model.x, model.y, model.width, model.height = geometry
+                if hasattr(item, 'update_handles'):
+                    item.update_handles()
+                return
+
     def undo(self) -> None:
         """Restore previous state."""
         if len(self._undo_stack) <= 1:
@@ -87,19 +189,36 @@ class EditorScene(QGraphicsScene):
         # Move current state to redo stack
         current = self._undo_stack.pop()
         self._redo_stack.append(current)
+        top = self._undo_stack[-1]
+        self._top_state_cache = None if isinstance(top, GeometryDelta) else top
         
-        # Restore pre-action state
-        last = self._undo_stack[-1]
-        self._restore_from_snapshot(last)
+        if isinstance(current, GeometryDelta):
+            # The scene is exactly the state after the delta: just revert it
+            self._apply_delta(current, current.before)
+            self.update()
+            return
+
+        # Restore pre-action state: the nearest snapshot plus any deltas above it
+        base = len(self._undo_stack) - 1
+        while isinstance(self._undo_stack[base], GeometryDelta):
+            base -= 1
+        self._restore_from_snapshot(self._undo_stack[base])
+        for delta in self._undo_stack[base + 1:]:
+            self._apply_delta(delta, delta.after)
 
     def redo(self) -> None:
         """Restore next state."""
         if not self._redo_stack:
             return
             
-        snapshot = self._redo_stack.pop()
-        self._undo_stack.append(snapshot)
-        self._restore_from_snapshot(snapshot)
+        entry = self._redo_stack.pop()
+        self._undo_stack.append(entry)
+        self._top_state_cache = None if isinstance(entry, GeometryDelta) else entry
+        if isinstance(entry, GeometryDelta):
+            self._apply_delta(entry, entry.after)
+            self.update()
+        else:
+            self._restore_from_snapshot(entry)
 
     def _restore_from_snapshot(self, json_data: str) -> None:
         """Rebuild scene from a serialized Template."""
@@ -261,6 +380,8 @@ class EditorScene(QGraphicsScene):
         """Reconstruct template from current scene items."""
         items = []
         for item in self.items():
+            if hasattr(item, 'flush_pending_edits'):
+                item.flush_pending_edits()
             if hasattr(item, 'model') and item.parentItem() is None:
                 item.model.z = item.zValue()
                 self._sync_model_hierarchy(item)
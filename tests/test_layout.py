@@ -0,0 +1,55 @@
+"""
+Tests for the layout engine's flattening of element trees.
+"""
+
+from doclayout.core.models import (
+    BaseElement, BlockBase, BlockInstance, ElementType, PageSize, Template, VariableBinding,
+)
+from doclayout.engine.layout import LayoutEngine
+
+
+def _text(text="Hello", **kwargs):
+    return BaseElement(type=ElementType.TEXT, props={"text": text}, **kwargs)
+
+
+def test_clone_flat_copies_props_and_shares_bindings():
+    binding = VariableBinding(variable_name="title", target_property="text")
+    child = _text("child")
+    element = _text(x=1, y=2, bindings=[binding], children=[child])
+
+    flat = element.clone_flat(10, 20)
+
+    assert (flat.x, flat.y) == (10, 20)
+    assert flat.children == []
+    assert flat.props == element.props
+    assert flat.props is not element.props
+    assert flat.bindings is element.bindings
+
+    flat.props["text"] = "changed"
+    assert element.props["text"] == "Hello"
+    assert element.children == [child]
+
+
+def test_compile_does_not_mutate_template():
+    child = _text("child", x=5, y=5)
+    root = BaseElement(type=ElementType.CONTAINER, x=10, y=20, children=[child])
+    template = Template(name="t", page_size=PageSize(width=100, height=100), items=[root])
+
+    elements = LayoutEngine({}).compile(template)
+
+    assert [(e.x, e.y) for e in elements] == [(10, 20), (15, 25)]
+    elements[1].props["text"] = "changed"
+    assert child.props["text"] == "child"
+    assert root.children == [child]
+
+
+def test_block_substitution_leaves_definition_untouched():
+    block = BlockBase(id="b", name="Block", width=50, height=20, elements=[_text("Hi {{ name }}")])
+    instance = BlockInstance(block_id="b", x=3, y=4, data={"name": "Ada"})
+    template = Template(name="t", page_size=PageSize(width=100, height=100), items=[instance])
+
+    elements = LayoutEngine({"b": block}).compile(template)
+
+    assert elements[0].props["text"] == "Hi Ada"
+    assert (elements[0].x, elements[0].y) == (3, 4)
+    assert block.elements[0].props["text"] == "Hi {{ name }}"